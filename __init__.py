@@ -21,31 +21,39 @@ Quick start:
 """
 
 from kagentic.agent import CodeAgent
+from kagentic.batch import arun_many
 from kagentic.memory import AgentMemory
 from kagentic.prompts import build_system_prompt, build_task_prompt
-from kagentic.schema import AgentReActStep
+from kagentic.schema import AgentReActStep, CompressedContext
+from kagentic.tokens import estimate_tokens
 from kagentic.tools.agent_tool import AgentTool
 from kagentic.tools.base import Tool
+from kagentic.tools.compress_context import CompressContextTool
 from kagentic.tools.final_answer import FinalAnswerTool
 from kagentic.tools.python_runner import PythonCodeRunnerTool
 from kagentic.tools.web_browse import WebBrowseTool
 from kagentic.tools.web_search import WebSearchTool
-from kagentic.types import Document, StepResult, ToolInput
+from kagentic.types import Document, StepRecord, StepResult, ToolInput
 
 __all__ = [
     # Agent
     "CodeAgent",
+    "arun_many",
     # Types
     "Document",
     "ToolInput",
     "StepResult",
+    "StepRecord",
     # Schema
     "AgentReActStep",
+    "CompressedContext",
     # Memory
     "AgentMemory",
+    "estimate_tokens",
     # Tools
     "AgentTool",
     "Tool",
+    "CompressContextTool",
     "FinalAnswerTool",
     "PythonCodeRunnerTool",
     "WebBrowseTool",
@@ -10,11 +10,15 @@ kbench automatically tracks conversation history inside that context, so we
 never need to pass a message list manually.
 
 Loop per step:
-  1. LLM produces a JSON-structured AgentReActStep (thought + tool_name + args)
+  1. LLM produces a JSON-structured AgentReActStep (thought + tool_name + args,
+     plus optional parallel_actions for independent calls)
   2. If tool_name == "final_answer" → parse answer (with retry on format failure).
   3. Otherwise: run the tool inside an isolated kbench.chats.new("tool_<name>")
-     sub-chat (so the orchestrator never sees raw tool internals).
-  4. Inject the tool result back into orchestrator history via tool_actor.send().
+     sub-chat (so the orchestrator never sees raw tool internals).  Multiple
+     actions in one step run concurrently on the agent's own thread pool
+     (max_workers threads, default TOOL_CONCURRENCY_LIMIT or 8; released by
+     close() or by leaving a ``with agent:`` block).
+  4. Inject the tool results back into orchestrator history via tool_actor.send().
   5. Call llm.respond(schema=AgentReActStep) to get the next step.
 
 Context compression (optional)
@@ -23,46 +27,139 @@ If compress_threshold > 0, every N steps AgentMemory.should_compress() fires:
   - We ask the LLM to summarize everything so far (still inside current chat).
   - We close the chat and reopen a fresh one seeded with the summary.
   - This keeps orchestrator tokens bounded for long-running agents.
+compress_token_budget > 0 fires the same restart once the window's messages
+reach that many estimated tokens (kagentic/tokens.py), whatever the step count.
+With compress_tool=True the LLM can also trigger the same restart itself by
+calling the compress_context tool; compress_threshold then acts as a hard
+upper bound (or is disabled with 0).
+With compress_strategy="structured" the summary is instead built in two
+stages: the window's step records are rendered as an observation log (no
+LLM), then one reflector call distils that log into a CompressedContext.
+With compress_strategy="compact" there is no LLM call at all: the window's
+step records are pruned line by line (AgentMemory.compact_verbatim) and the
+surviving lines are carried over byte-identical.
+With compress_strategy="focus" only the older steps are summarised (one LLM
+call, appended to a knowledge block that persists for the run); the most
+recent steps are carried over verbatim.  "sliding_window" just keeps the
+most recent steps, with no LLM call.
 
 Structured output (response_format)
 ====================================
 All structured-output logic lives in FinalAnswerTool (tools/final_answer.py):
   - Schema hints injected into the tool description on every LLM turn.
   - Multi-strategy parse waterfall (JSON / Python dict / json_repair).
-  - On parse failure, _execute_step returns is_final=False so the existing
+  - On parse failure, _execute_one returns is_final=False so the existing
     observation-feedback loop retries — no duplicated code.
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import hashlib
 import json
-try:
-    from json_repair import loads as json_loads
-except ImportError:
-    import json
-    json_loads = json.loads  # fallback if json_repair not installed
-
-import json as _json
-from typing import Any, Dict, List, Optional, Type, Union
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Type, Union
 
 try:
     from pydantic import BaseModel
 except ImportError:
     BaseModel = None  # type: ignore[assignment,misc]
 
-import kaggle_benchmarks as kbench
-from kaggle_benchmarks import actors as kbench_actors
+# kaggle_benchmarks is imported inside the methods that need it (as in
+# tools/python_runner.py) so importing kagentic for Tool subclasses alone
+# does not pay for the heavy kbench import.
 
+from kagentic.batch import arun_many
 from kagentic.memory import AgentMemory
 from kagentic.prompts import build_system_prompt, build_task_prompt
-from kagentic.schema import AgentReActStep
+from kagentic.schema import AgentReActStep, CompressedContext, ToolCall, get_json_repair_loads
 from kagentic.tools.base import Tool
+from kagentic.tools.compress_context import CompressContextTool
 from kagentic.tools.final_answer import FinalAnswerTool
-from kagentic.types import StepResult
+from kagentic.types import StepRecord, StepResult
 
 # Imported lazily inside __init__ to avoid circular imports
 # (AgentTool → agent.py → AgentTool)
 
 
+# LLM-call failures are classified by exception class name (and HTTP status
+# where present) so no provider SDK has to be imported here.
+_TRANSIENT_LLM_ERRORS = frozenset({
+    "RateLimitError", "Timeout", "TimeoutError", "APITimeoutError",
+    "ReadTimeout", "ConnectTimeout", "APIConnectionError", "ConnectionError",
+    "InternalServerError", "ServiceUnavailableError", "ResourceExhausted",
+})
+_PERMANENT_LLM_ERRORS = frozenset({
+    "AuthenticationError", "PermissionDeniedError", "PermissionDenied",
+    "NotFoundError",
+})
+
+
+def _classify_llm_error(exc: Exception) -> str:
+    """Return ``"transient"``, ``"permanent"`` or ``"parse"`` for an LLM-call error.
+
+    Transient errors (rate limits, timeouts, 5xx) are worth retrying after a
+    pause; permanent ones (bad credentials, unknown model) never succeed on
+    retry.  Anything else is treated as a response parse/validation failure,
+    which the format-correction retry can fix.
+    """
+    name = type(exc).__name__
+    status = getattr(exc, "status_code", None)
+    if name in _TRANSIENT_LLM_ERRORS or status == 429 or (isinstance(status, int) and status >= 500):
+        return "transient"
+    if name in _PERMANENT_LLM_ERRORS or status in (401, 403, 404):
+        return "permanent"
+    return "parse"
+
+
+def _sleep_backoff(attempt: int) -> None:
+    """Sleep with capped exponential backoff plus jitter before a retry."""
+    time.sleep(min(0.25 * (2 ** attempt) + random.random() * 0.1, 4.0))
+
+
+# Shared by every agent without a response_format: the plain FinalAnswerTool
+# is stateless, so there is no need to build one per agent.
+_DEFAULT_FINAL_ANSWER = FinalAnswerTool()
+
+_COMPRESS_STRATEGIES = ("summary", "structured", "compact", "focus", "sliding_window")
+
+# Thread cap for one step's parallel_actions when neither max_workers nor
+# TOOL_CONCURRENCY_LIMIT is given.
+_DEFAULT_TOOL_WORKERS = 8
+
+
+def _noop(*args: Any) -> None:
+    """Stand-in for the log methods when verbosity is 0."""
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_fast(raw: str) -> dict:
+    """Parse a tool_arguments JSON string, memoized on the raw string.
+
+    Well-formed JSON (the common case once the schema is enforced) goes
+    through the C-accelerated ``json.loads``; only a ``JSONDecodeError``
+    falls back to the slower ``json_repair`` (imported on first need).
+    Identical arguments — common when the LLM retries a call — skip parsing
+    entirely.
+    """
+    try:
+        result = json.loads(raw)
+    except json.JSONDecodeError:
+        repair = get_json_repair_loads()
+        if repair is None:
+            return {}
+        try:
+            result = repair(raw)
+        except Exception:
+            return {}
+    return result if type(result) is dict else {}
+
+
 class CodeAgent:
     """
     A ReAct-style code agent that runs inside the Kaggle Benchmarks framework.
@@ -84,13 +181,57 @@ class CodeAgent:
         verbosity_level:   0 = silent, 1 = step summaries, 2 = full thoughts.
         stream_outputs:    Not used by kbench LLMs (kept for API compatibility).
         compress_threshold: Compress orchestrator context every N steps (0 = off).
+        compress_token_budget: Also compress once a window's messages (first
+                           message, LLM steps, observations; not the system
+                           prompt) reach this many estimated tokens (0 = off).
+        compress_tool:     When ``True``, register ``CompressContextTool`` so the
+                           LLM can compress its own context when it judges the
+                           history redundant.  ``compress_threshold`` remains a
+                           hard upper bound if non-zero.
+        compress_strategy: How compression builds its summary.  ``"summary"``
+                           (default) asks the LLM for a free-text summary of
+                           the whole chat; ``"structured"`` runs the two-stage
+                           observer/reflector path and seeds the next window
+                           with a ``CompressedContext`` (goal, facts, failed
+                           attempts, open questions).  ``"compact"`` makes
+                           no LLM call: it drops low-signal lines (blank
+                           lines, HTTP headers, traceback frames, base64
+                           blobs) from the window's tool outputs and keeps
+                           the rest verbatim (recent steps up to
+                           ``max_observation_chars``, older ones shorter).
+                           ``"focus"`` summarises only the older steps into
+                           a run-long knowledge block and keeps the recent
+                           ones verbatim; ``"sliding_window"`` keeps just the
+                           recent steps (no LLM call).
         additional_instructions: Extra instructions appended to the system prompt.
+                           Keep it identical across a batch of runs so the
+                           provider's prompt-prefix cache can hit.
         response_format:   Optional Pydantic BaseModel subclass. When set, the
                            agent instructs the LLM to output a JSON object matching
                            the model's schema inside ``final_answer.answer``, then
                            automatically parses and validates that JSON before
                            returning the typed model instance from ``run()``.
                            If ``None`` (default), ``run()`` returns a plain ``str``.
+        return_full_result: When ``True``, ``run()`` returns the list of
+                           ``StepRecord`` entries for the whole run instead of
+                           only the final answer.
+        max_observation_chars: Cap on each tool output fed back to the LLM as an
+                           observation (0 = no cap).  Longer outputs are cut
+                           and marked ``...[truncated]``.
+        response_cache:    Optional mapping (``dict``, an LRU cache,
+                           ``diskcache.Cache`` …) memoising LLM steps.  Keys
+                           hash the transcript up to the call (system prompt,
+                           every message, schema name); values are the step
+                           JSON.  A hit replays the turn into the chat instead
+                           of calling the LLM — useful when re-running the
+                           same task while debugging.  ``None`` (default) = off.
+        max_workers:       Most tool calls of one step run at once.  ``None``
+                           (default) reads the ``TOOL_CONCURRENCY_LIMIT`` env
+                           var, else 8; ``1`` runs them one after another.
+                           The pool starts with the first multi-action step
+                           and only spawns as many threads as actions need;
+                           ``close()`` (or ``with CodeAgent(...) as agent:``)
+                           shuts it down.
 
     Usage (plain string)::
 
@@ -133,9 +274,15 @@ class CodeAgent:
         verbosity_level: int = 1,
         stream_outputs: bool = False,
         compress_threshold: int = 0,
+        compress_token_budget: int = 0,
+        compress_tool: bool = False,
+        compress_strategy: str = "summary",
         additional_instructions: str = "",
         response_format: Optional[Any] = None,
         return_full_result: bool = False,
+        max_observation_chars: int = 8192,
+        response_cache: Optional[MutableMapping[str, str]] = None,
+        max_workers: Optional[int] = None,
     ):
         self.name = name
         self.description = description
@@ -146,49 +293,131 @@ class CodeAgent:
         self.response_format = response_format
         self.additional_instructions = additional_instructions
         self.return_full_result = return_full_result
+        self.max_observation_chars = max_observation_chars
+        self.response_cache = response_cache
+        if compress_strategy not in _COMPRESS_STRATEGIES:
+            raise ValueError(
+                f"compress_strategy must be one of {_COMPRESS_STRATEGIES}, got {compress_strategy!r}."
+            )
+        self.compress_strategy = compress_strategy
+        # Step records are only built when something reads them.
+        self._record_steps: bool = return_full_result or compress_strategy != "summary"
 
         # Wrap managed worker agents as AgentTools and merge into the tool list.
         # Import here to avoid a circular import (agent_tool imports agent).
         from kagentic.tools.agent_tool import AgentTool
 
-        agent_tools: List[Tool] = [
-            AgentTool(worker) for worker in (managed_agents or [])
-        ]
         # Caller's explicit tools come first; worker AgentTools appended after.
-        tools = list(tools) + agent_tools
+        tools_out: List[Tool] = [
+            *tools,
+            *(AgentTool(worker) for worker in (managed_agents or [])),
+        ]
+        # Interned keys: the names the LLM emits are compared against these on
+        # every step, and interned strings short-circuit on identity.
+        self._tool_map: Dict[str, Tool] = {sys.intern(t.name): t for t in tools_out}
 
         # Always include FinalAnswerTool — pass response_format so it
         # self-configures (patches descriptions + owns parse_answer logic).
-        tool_names = {t.name for t in tools}
-        if "final_answer" not in tool_names:
-            tools = list(tools) + [FinalAnswerTool(response_format=response_format)]
-        self.tools = tools
-        self._tool_map: Dict[str, Tool] = {t.name: t for t in tools}
-
-        self.memory = AgentMemory(compress_threshold=compress_threshold)
-
-        # A dedicated actor for injecting tool observations back into chat history.
-        # Initialized once here (not inside the loop) with role="assistant" so the
-        # LLM sees it as a peer turn rather than a user prompt.
-        self.tool_actor = kbench_actors.Actor(
-            name="Tool",
-            role="assistant",
-            avatar="🔧",
+        # Built-ins are appended in place; the map doubles as the name set.
+        builtins: List[Tool] = []
+        if "final_answer" not in self._tool_map:
+            builtins.append(
+                FinalAnswerTool(response_format=response_format)
+                if response_format is not None
+                else _DEFAULT_FINAL_ANSWER
+            )
+        if compress_tool and "compress_context" not in self._tool_map:
+            builtins.append(CompressContextTool())
+        for tool in builtins:
+            tools_out.append(tool)
+            self._tool_map[tool.name] = tool
+        self.tools = tools_out
+        self._final_tool = self._tool_map["final_answer"]
+        # Only the built-in CompressContextTool is intercepted by the loop; a
+        # user tool that happens to be called "compress_context" runs normally.
+        self._compress_intercept = isinstance(
+            self._tool_map.get("compress_context"), CompressContextTool
         )
+        # The tool set is fixed after __init__, so each tool gets a runner
+        # specialised once (AgentTool or sub-chat wrapped, chat name baked
+        # in) and the hot path is a single dict lookup + call.
+        self._runners: Dict[str, Callable[[dict], Any]] = {
+            name: self._make_runner(tool, isinstance(tool, AgentTool))
+            for name, tool in self._tool_map.items()
+        }
+
+        # response_format is fixed for the agent's lifetime, so the schema hint
+        # and the final_answer correction message around the parse error are
+        # rendered once here instead of on every failed parse.
+        self._schema_hint: Optional[str] = None
+        self._correction_prefix = self._correction_suffix = ""
+        if response_format is not None:
+            self._schema_hint = FinalAnswerTool._build_schema_hint(response_format)
+            self._correction_prefix = (
+                "Your final_answer was rejected because the 'answer' value "
+                "did not match the required JSON schema.\n"
+                "Error: "
+            )
+            self._correction_suffix = (
+                f"\nPlease call final_answer again with a properly JSON-encoded "
+                f"object matching this schema: {self._schema_hint}\n"
+                f"Example: {{\"answer\": \"{self._schema_hint}\"}}"
+            )
+
+        # Rendered lazily by _get_system_prompt() and reused across run()
+        # calls and compression restarts until the inputs change.
+        self._cached_system_prompt: Optional[str] = None
+        self._system_prompt_key: Optional[tuple] = None
+
+        self.memory = AgentMemory(
+            compress_threshold=compress_threshold,
+            compress_token_budget=compress_token_budget,
+        )
+
+        # Dedicated actor for injecting tool observations; built on first use
+        # by the tool_actor property.
+        self._tool_actor: Any = None
+        # Observations queued during one step; _flush_observations() sends
+        # them as a single tool_actor turn right before the next LLM call.
+        self._pending_observations: List[str] = []
+        # Whether the LLM wraps results in a Message; probed on first call.
+        self._llm_returns_message: Optional[bool] = None
+
+        # Response cache state.  _transcript_key is a running hash of the
+        # active chat (reset per window by _reset_transcript), so cache keys
+        # never depend on reading kbench's message list back.
+        self._cache_enabled: bool = response_cache is not None
+        self._transcript_key: str = ""
+        self._replay_actor: Any = None
 
         # Populated by _inner_loop at every step. Always initialized here so
         # workers called via AgentTool (which bypasses run()) have it ready.
-        self._step_history: List[Dict[str, Any]] = []
+        self._step_history: List[StepRecord] = []
+        self._step_idx: int = 0
+        # step_idx of the first record in the current chat window; the
+        # structured/compact compressors only read records from this point on.
+        self._window_start: int = 0
+
+        # Runs independent tool calls from one step concurrently.  Each agent
+        # owns its pool so a worker agent called from inside a Manager's pool
+        # never waits on a slot held by its own caller (no nested deadlock).
+        # Created on first use; close() shuts it down.
+        if max_workers is None:
+            max_workers = int(os.getenv("TOOL_CONCURRENCY_LIMIT", _DEFAULT_TOOL_WORKERS))
+        self.max_workers = max(1, max_workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def run(self, task: str) -> Any:
+    def run(self, task: str, cache: bool = True) -> Any:
         """
         Execute the ReAct loop for the given task and return the final answer.
 
         Args:
-            task: Natural-language task description.
+            task:  Natural-language task description.
+            cache: Set ``False`` to bypass ``response_cache`` for this run
+                   (every step calls the LLM and nothing is stored).
 
         Returns:
             - If ``response_format`` is None: a ``str`` answer.
@@ -200,24 +429,120 @@ class CodeAgent:
             ValueError: If ``response_format`` is set but the LLM's answer could
                 not be parsed/validated into the requested model.
         """
-        self._log(f"\n{'='*60}")
-        self._log(f"🤖 kagentic starting — model: {getattr(self.model, 'name', str(self.model))}")
-        self._log(f"📋 Task: {task[:120]}{'...' if len(task) > 120 else ''}")
-        if self.response_format is not None:
-            self._log(f"📐 response_format: {self.response_format.__name__}")
-        self._log(f"{'='*60}\n")
-
-        system_prompt = build_system_prompt(
-            self.tools,
-            self.additional_instructions,
-            response_format=self.response_format,
-        )
+        if self.verbosity >= 1:
+            self._log(f"\n{'='*60}")
+            self._log(f"🤖 kagentic starting — model: {getattr(self.model, 'name', str(self.model))}")
+            self._log(f"📋 Task: {task[:120]}{'...' if len(task) > 120 else ''}")
+            if self.response_format is not None:
+                self._log(f"📐 response_format: {self.response_format.__name__}")
+            self._log(f"{'='*60}\n")
+
+        system_prompt = self._get_system_prompt()
         task_prompt = build_task_prompt(task)
 
         # Reset step history at the start of each run() so repeated calls
         # on the same agent instance don't accumulate across tasks.
         self._step_history = []
+        self._step_idx = 0
+        self.memory.reset()
+        self.memory.knowledge_block.clear()
+        self._cache_enabled = cache and self.response_cache is not None
+
+        import kaggle_benchmarks as kbench
+
+        if getattr(kbench.chats, "truncate", None) is not None:
+            # This kbench can truncate a chat in place: keep ONE orchestrator
+            # chat for the whole run and truncate it (keeping the system
+            # prompt) on compression, instead of opening a new chat that
+            # re-sends and re-tokenizes the system prompt every window.
+            with kbench.chats.new(name="kagentic_orchestrator_1", system_instructions=system_prompt):
+                return self._run_windows(system_prompt, task_prompt, reuse_chat=True)
+        return self._run_windows(system_prompt, task_prompt, reuse_chat=False)
+
+    def close(self) -> None:
+        """Shut down the thread pool used for parallel tool calls.
+
+        Safe to call more than once; a later multi-action step starts a new
+        pool.  Managed agents are not closed — their owner closes them.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "CodeAgent":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def arun(self, task: str) -> Any:
+        """
+        Async counterpart of ``run()`` for overlapping several agent runs.
+
+        The ReAct loop itself stays synchronous: it runs in a worker thread
+        (``asyncio.to_thread``, which copies the caller's contextvars so kbench
+        chats still attach to the active task), and the blocking LLM and tool
+        calls release the GIL while they wait.  Gathering N ``arun()`` calls
+        therefore takes roughly the time of the slowest run, not the sum::
+
+            answers = await asyncio.gather(*(make_agent().arun(q) for q in questions))
 
+        Use one agent instance per concurrent run — an agent's step history,
+        memory and observation queue belong to a single run at a time.
+        ``run()`` is unchanged and still safe inside notebooks that already
+        have a running event loop.
+        """
+        return await asyncio.to_thread(self.run, task)
+
+    @classmethod
+    async def arun_many(
+        cls,
+        tasks: List[str],
+        *,
+        max_concurrency: int = 10,
+        rate_limit_rpm: Optional[float] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        **agent_kwargs: Any,
+    ) -> List[Any]:
+        """
+        Run many tasks concurrently, each on a fresh agent built from
+        ``agent_kwargs`` (see ``kagentic.batch.arun_many``)::
+
+            answers = await CodeAgent.arun_many(
+                questions, tools=[WebSearchTool()], model=kbench.llm, max_concurrency=8,
+            )
+
+        Results come back in task order; a run that raised is returned as its
+        exception.  Tool instances in ``agent_kwargs`` are shared by all runs.
+
+        ``managed_agents`` are rejected: a worker keeps per-run chat and step
+        state, so concurrent managers must not share one.  Pass
+        ``kagentic.batch.arun_many`` a factory that builds fresh workers for
+        every manager instead.
+        """
+        if agent_kwargs.get("managed_agents"):
+            raise ValueError(
+                "arun_many cannot share managed_agents across concurrent runs; use "
+                "kagentic.batch.arun_many with a factory that builds new workers per run."
+            )
+        return await arun_many(
+            lambda: cls(**agent_kwargs),
+            tasks,
+            max_concurrency=max_concurrency,
+            rate_limit_rpm=rate_limit_rpm,
+            on_progress=on_progress,
+        )
+
+    def _run_windows(self, system_prompt: str, task_prompt: str, reuse_chat: bool) -> Any:
+        """
+        Run chat windows until a final answer or the step budget is spent.
+
+        Each window is one ``_run_loop`` call; a compression result starts the
+        next window seeded with the summary.  With ``reuse_chat=True`` the
+        caller already opened the orchestrator chat, and compression truncates
+        it in place via ``kbench.chats.truncate(keep_system=True)``; otherwise
+        every window opens its own indexed ``kbench.chats.new()``.
+        """
         # Run the full loop, supporting context compression restarts
         remaining_steps = self.max_steps
         total_steps = 0          # cumulative steps across all compression windows
@@ -225,18 +550,21 @@ class CodeAgent:
         seed_context: Optional[str] = None  # set after compression
 
         while remaining_steps > 0:
+            # Every window starts from a chat holding only the system prompt.
+            self._reset_transcript(system_prompt)
             result = self._run_loop(
                 system_prompt=system_prompt,
                 task_prompt=task_prompt,
                 max_steps=remaining_steps,
                 seed_context=seed_context,
                 chat_index=chat_index,
+                use_existing_context=reuse_chat,
             )
             if result.is_final:
                 total_steps += self.memory.step_count
                 self._log(f"\n✅ Final answer after {total_steps} steps.")
                 if self.return_full_result:
-                    return self._step_history
+                    return list(self._step_history)
                 return result.parsed      # str or Pydantic instance
 
             # Loop returned early due to compression
@@ -247,6 +575,10 @@ class CodeAgent:
                 remaining_steps -= steps_consumed
                 chat_index += 1              # new indexed chat name next iteration
                 seed_context = result.output
+                if reuse_chat:
+                    import kaggle_benchmarks as kbench
+
+                    kbench.chats.truncate(keep_system=True)
                 self._log(f"\n🔄 Context compressed. Continuing with {remaining_steps} steps left.")
             else:
                 break  # max steps exhausted
@@ -258,6 +590,27 @@ class CodeAgent:
     # ------------------------------------------------------------------
     # Internal loop
     # ------------------------------------------------------------------
+    def _get_system_prompt(self) -> str:
+        """Return the system prompt, rendering it only when its inputs change.
+
+        Keyed on the identity of every tool plus ``additional_instructions``
+        and ``response_format``, so replacing or appending a tool (or editing
+        the instructions) re-renders while repeated runs reuse the string.
+        """
+        key = (
+            tuple(id(t) for t in self.tools),
+            self.additional_instructions,
+            self.response_format,
+        )
+        if self._cached_system_prompt is None or key != self._system_prompt_key:
+            self._cached_system_prompt = build_system_prompt(
+                self.tools,
+                self.additional_instructions,
+                response_format=self.response_format,
+            )
+            self._system_prompt_key = key
+        return self._cached_system_prompt
+
     def _run_loop(
         self,
         system_prompt: str,
@@ -271,7 +624,8 @@ class CodeAgent:
         Open one kbench.chats.new() context and run up to max_steps iterations.
 
         Args:
-            use_existing_context: When ``True`` (set by ``AgentTool``), the caller
+            use_existing_context: When ``True`` (set by ``AgentTool``, or by
+                ``run()`` when the chat is truncated in place), the caller
                 has already established the correct chat context via
                 ``contexts.enter(chat=worker_chat)``.  We skip opening a new
                 ``kbench.chats.new()`` and instead send the first message directly
@@ -291,6 +645,8 @@ class CodeAgent:
                 seed_context=seed_context,
             )
         else:
+            import kaggle_benchmarks as kbench
+
             chat_name = f"kagentic_orchestrator_{chat_index}"
             with kbench.chats.new(name=chat_name, system_instructions=system_prompt):
                 return self._inner_loop(
@@ -309,10 +665,20 @@ class CodeAgent:
         The actual ReAct step loop. Expects the correct chat context to already
         be active (either from kbench.chats.new or contexts.enter).
 
-        Always accumulates every StepResult into ``result.steps`` on the final
-        returned StepResult, so ``run()`` can surface it when
-        ``return_full_result=True``.
+        Appends a ``StepRecord`` per result to ``_step_history`` when it will
+        be read (``return_full_result=True`` or a record-based compressor), so
+        ``run()`` can surface it.
         """
+        # Drop anything left queued by a window that ended early (error/compress).
+        self._pending_observations.clear()
+        self._window_start = self._step_idx
+        # The compressors only read the current window, so unless the caller
+        # wants the full result, earlier windows' records can go.  The live
+        # window itself is unbounded: a step with parallel actions records
+        # one entry per action.
+        if not self.return_full_result:
+            self._step_history.clear()
+
         # First user message: either the task or a compressed-context continuation
         first_message = (
             self.memory.format_summary_as_context(seed_context) + "\n\n" + task_prompt
@@ -325,65 +691,231 @@ class CodeAgent:
         if step is None:
             return StepResult(tool_name="error", output="LLM failed to respond.", is_final=True)
 
-        for i in range(max_steps):
-            self._log_step(i, step)
-
-            # Execute the step (intercepts final_answer before calling tool)
-            result = self._execute_step(step)
-            self.memory.increment()  # kbench chat already tracks full context
-
-            # Record this step as a plain dict in the shared run history.
-            self._step_history.append({
-                "step_idx":  len(self._step_history),
-                "thought":   step.thought,
-                "tool_name": result.tool_name,
-                "output":    result.output,
-                "is_final":  result.is_final,
-                "parsed":    result.parsed,
-            })
+        # Hot-loop methods bound once as locals (skips attribute lookups per step).
+        log_step = self._log_step
+        execute = self._execute_step
+        incr = self.memory.increment
+        should_compress = self.memory.should_compress
+        respond = self._safe_respond
+        format_obs = self._format_observation
+        queue_obs = self._pending_observations.append
+        history_append = self._step_history.append
+        record_steps = self._record_steps
 
+        for i in range(max_steps):
+            log_step(i, step)
+
+            # Execute every action of the step (intercepts final_answer before
+            # calling any tool).  Independent actions run concurrently.
+            results = execute(step)
+            incr()  # kbench chat already tracks full context
+
+            # Record each result in the shared run history — only when someone
+            # will read it (return_full_result or a record-based compressor).
+            # Done here on the calling thread, never inside the pool workers.
+            if record_steps:
+                for result in results:
+                    history_append(StepRecord(
+                        step_idx=self._step_idx,
+                        thought=step.thought,
+                        tool_name=result.tool_name,
+                        output=result.output,
+                        is_final=result.is_final,
+                        parsed=result.parsed,
+                    ))
+                    self._step_idx += 1
+
+            result = results[0]
             if result.is_final:
                 return result
 
-            # Check compression AFTER incrementing so count is current.
-            # Fires every compress_threshold steps exactly.
-            if self.memory.should_compress():
-                # The chat already holds full context — just ask for a summary.
-                kbench.user.send(AgentMemory.SUMMARY_PROMPT)
-                summary = self.model.respond()   # plain text summary, no schema
+            # Compress when the agent asked for it (compress_context), or
+            # every compress_threshold steps as a hard bound.  Checked AFTER
+            # incrementing so the count is current.
+            if result.tool_name == "compress" or should_compress():
                 return StepResult(
                     tool_name="compress",
-                    output=str(summary),
+                    output=self._compress(task_prompt),
                     is_final=False,
                 )
 
-            # Feed observation back into orchestrator history via tool_actor
-            observation_msg = f"Observation from '{result.tool_name}':\n{result.output}"
-            self.tool_actor.send(observation_msg)
+            # Queue observations; _safe_respond() flushes them into the
+            # orchestrator history as one tool_actor turn.
+            for r in results:
+                queue_obs(format_obs(r))
 
             # Get the next LLM step (responds to the full accumulated history)
-            step = self._safe_respond()
+            step = respond()
             if step is None:
                 return StepResult(tool_name="error", output="LLM failed mid-loop.", is_final=True)
 
         return StepResult(tool_name="max_steps", output="", is_final=False)
 
+    def _compress(self, task_prompt: str) -> str:
+        """Return the summary that seeds the next chat window.
+
+        ``"summary"``: the chat already holds full context — just ask the LLM
+        for a plain-text summary inside it.
+
+        ``"structured"``: observe this window's step records (no LLM), then
+        make one reflector call in a throwaway sub-chat with
+        ``schema=CompressedContext``.  If the reflector fails, the raw
+        observation log is used as the summary instead.
+
+        ``"compact"``: no LLM call — this window's step records are pruned
+        line by line and the surviving lines carried over verbatim.
+
+        ``"sliding_window"``: no LLM call — only the most recent steps are
+        carried over.
+
+        ``"focus"``: the most recent steps are carried over verbatim; older
+        ones that score as relevant are summarised in one sub-chat call and
+        appended to the memory's knowledge block, which seeds every later
+        window of the run.
+        """
+        strategy = self.compress_strategy
+        if strategy != "summary":
+            window = [r for r in self._step_history if r.step_idx >= self._window_start]
+        if strategy == "compact":
+            # Recent steps keep as much as the LLM was shown of them.
+            return "\n".join(
+                self.memory.compact_verbatim(window, recent_chars=self.max_observation_chars or None)
+            )
+        if strategy == "sliding_window":
+            return self.memory.observe(window[-AgentMemory.KEEP_RECENT:])
+
+        import kaggle_benchmarks as kbench
+
+        if strategy == "focus":
+            memory = self.memory
+            split = max(0, len(window) - AgentMemory.KEEP_RECENT)
+            newest = len(window) - 1
+            old = [
+                r for i, r in enumerate(window[:split])
+                if memory.score_relevance(r, newest - i) >= memory.FOCUS_MIN_SCORE
+            ]
+            if old:
+                observations = memory.observe(old)
+                try:
+                    with kbench.chats.new(name="kagentic_compress"):
+                        knowledge = self.model.prompt(memory.build_focus_prompt(task_prompt, observations))
+                    memory.knowledge_block.append(str(getattr(knowledge, "content", knowledge)))
+                except Exception as e:
+                    self._log(f"  ⚠️  Focus compression failed ({type(e).__name__}) — keeping raw step log.")
+                    memory.knowledge_block.append(observations)
+            return memory.format_focus_context(window[split:])
+
+        if strategy == "structured":
+            observations = self.memory.observe(window)
+            try:
+                with kbench.chats.new(name="kagentic_compress"):
+                    ctx = self.model.prompt(
+                        self.memory.build_reflector_prompt(task_prompt, observations),
+                        schema=CompressedContext,
+                    )
+                ctx = getattr(ctx, "content", ctx)
+                return self.memory.format_compressed_context(ctx)
+            except Exception as e:
+                self._log(f"  ⚠️  Structured compression failed ({type(e).__name__}) — using raw step log.")
+                return observations
+
+        kbench.user.send(AgentMemory.SUMMARY_PROMPT)
+        summary = self.model.respond()   # plain text summary, no schema
+        return str(summary)
+
     # ------------------------------------------------------------------
     # Step execution
     # ------------------------------------------------------------------
-    def _parse_args(self, raw: str) -> dict:
-        """Parse tool_arguments JSON string using json_repair for robustness."""
+    def _parse_args(self, raw: Union[Dict[str, Any], str]) -> dict:
+        """Return tool arguments as a dict.
+
+        Native dicts (the normal case) are used as-is; JSON strings go
+        through ``_parse_fast`` (json fast path, json_repair fallback).
+        Returns a fresh top-level dict so callers can never mutate the
+        validated step or the memoized copy held by ``_parse_fast``.
+        """
+        if type(raw) is dict:
+            return dict(raw)
         try:
-            result = json_loads(raw)
-            if not isinstance(result, dict):
-                return {}
-            return result
-        except Exception:
-            return {}
+            return dict(_parse_fast(raw))
+        except TypeError:
+            return {}  # unhashable / non-string arguments
 
-    def _execute_step(self, step: AgentReActStep) -> StepResult:
+    def _execute_step(self, step: AgentReActStep) -> List[StepResult]:
         """
-        Execute one ReAct step.
+        Execute every action of one ReAct step and return their results in
+        the order the LLM listed them.
+
+        If any action is ``final_answer`` it is executed alone and the other
+        actions are dropped — the loop is about to end anyway.  Likewise a
+        call to the built-in ``compress_context`` tool returns a bare
+        ``"compress"`` result without running anything, so the window
+        restarts.  A single action (or any step when ``max_workers == 1``)
+        runs inline; several independent actions are submitted to
+        ``self._pool`` and gathered with ``as_completed``.  Each submission
+        runs inside a copy of the caller's ``contextvars`` context so the
+        tool's kbench sub-chat is opened in the worker thread but still
+        attaches to the active orchestrator chat.
+        """
+        actions = step.actions
+        for action in actions:
+            if action.name == "final_answer":
+                return [self._execute_one(action)]
+        if self._compress_intercept and any(a.name == "compress_context" for a in actions):
+            # Agent-requested compression: skip every other action, the
+            # window is about to be summarised and restarted.
+            return [StepResult(tool_name="compress", output="", is_final=False)]
+
+        if len(actions) == 1 or self.max_workers == 1:
+            return [self._execute_one(action) for action in actions]
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"kagentic_{self.name}",
+            )
+        futures = {
+            self._pool.submit(contextvars.copy_context().run, self._execute_one, action): idx
+            for idx, action in enumerate(actions)
+        }
+        results: List[Optional[StepResult]] = [None] * len(actions)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _make_runner(tool: Tool, is_agent_tool: bool) -> Callable[[dict], Any]:
+        """Return a callable ``runner(args) -> output`` specialised for ``tool``."""
+        forward = tool.forward
+        if is_agent_tool:
+            # AgentTool (worker agent) manages its own persistent chat context
+            # via contexts.enter(chat=worker_chat) inside forward() — no outer
+            # wrapper needed. This avoids the double-nesting:
+            #   kagentic_tool_search_agent
+            #     └─ kagentic_worker_search_agent   ← unwanted
+            # and gives a clean single chat:
+            #   kagentic_worker_search_agent
+            def run_agent_tool(args: dict) -> Any:
+                return forward(**args)
+            return run_agent_tool
+
+        # Regular tool: run in an isolated throwaway sub-chat so the
+        # orchestrator never accumulates raw tool internals.
+        chat_name = f"kagentic_tool_{tool.name}"
+
+        def run_isolated(args: dict) -> Any:
+            import kaggle_benchmarks as kbench
+
+            with kbench.chats.new(name=chat_name):
+                return forward(**args)
+        return run_isolated
+
+    def _execute_one(self, action: ToolCall) -> StepResult:
+        """
+        Execute a single tool call and return its StepResult.
+
+        Free of loop side effects (no tool_actor.send, no history append) so
+        it is safe to run from a pool worker thread.
 
         final_answer handling
         ---------------------
@@ -396,12 +928,14 @@ class CodeAgent:
         All other tools run inside their own isolated kbench.chats.new()
         sub-chat so the orchestrator never accumulates raw tool internals.
         """
-        tool_name = step.action.name
-        args = self._parse_args(step.action.arguments)
+        tool_name = action.name
+        args = self._parse_args(action.arguments)
 
         if tool_name == "final_answer":
-            raw_answer = args.get("answer", step.action.arguments)
-            final_tool = self._tool_map["final_answer"]
+            raw_answer = args.get("answer")
+            if raw_answer is None:
+                raw_answer = action.arguments if isinstance(action.arguments, str) else json.dumps(args)
+            final_tool = self._final_tool
 
             # --- Attempt 1 (eager): flat-spread args ---
             # Some weaker LLMs call final_answer({"answer": "x", "explanation": "y"})
@@ -413,11 +947,11 @@ class CodeAgent:
             first_exc: Optional[Exception] = None
             if self.response_format is not None and isinstance(args, dict) and len(args) > 1:
                 try:
-                    parsed = final_tool.parse_answer(_json.dumps(args))
+                    parsed = final_tool.parse_answer(json.dumps(args))
                     self._log("  ℹ️  Accepted structured output from flat args dict (auto-recovered).")
                     return StepResult(
                         tool_name="final_answer",
-                        output=_json.dumps(args),
+                        output=json.dumps(args),
                         is_final=True,
                         parsed=parsed,
                     )
@@ -437,15 +971,7 @@ class CodeAgent:
                 first_exc = exc
 
             # --- All attempts failed → send correction feedback ---
-            schema_hint = final_tool._build_schema_hint(self.response_format)
-            correction = (
-                f"Your final_answer was rejected because the 'answer' value "
-                f"did not match the required JSON schema.\n"
-                f"Error: {first_exc}\n"
-                f"Please call final_answer again with a properly JSON-encoded "
-                f"object matching this schema: {schema_hint}\n"
-                f"Example: {{\"answer\": \"{schema_hint}\"}}"
-            )
+            correction = f"{self._correction_prefix}{first_exc}{self._correction_suffix}"
             self._log(f"  ⚠️  response_format parse failed — requesting retry.")
             return StepResult(
                 tool_name="final_answer",
@@ -453,8 +979,8 @@ class CodeAgent:
                 is_final=False,
             )
 
-        tool = self._tool_map.get(tool_name)
-        if tool is None:
+        runner = self._runners.get(tool_name)
+        if runner is None:
             error_msg = (
                 f"Unknown tool '{tool_name}'. "
                 f"Available tools: {list(self._tool_map.keys())}."
@@ -463,26 +989,13 @@ class CodeAgent:
             return StepResult(tool_name=tool_name, output=error_msg, is_final=False)
 
         try:
-            self._log(f"  🔧 Calling tool: {tool_name}({step.action.arguments})")
-
-            # AgentTool (worker agent) manages its own persistent chat context
-            # via contexts.enter(chat=worker_chat) inside forward() — no outer
-            # wrapper needed. This avoids the double-nesting:
-            #   kagentic_tool_search_agent
-            #     └─ kagentic_worker_search_agent   ← unwanted
-            # and gives a clean single chat:
-            #   kagentic_worker_search_agent
-            from kagentic.tools.agent_tool import AgentTool
-            if isinstance(tool, AgentTool):
-                output = tool.forward(**args)
-            else:
-                # Regular tool: run in an isolated throwaway sub-chat so the
-                # orchestrator never accumulates raw tool internals.
-                with kbench.chats.new(name=f"kagentic_tool_{tool_name}"):
-                    output = tool.forward(**args)
+            if self.verbosity >= 1:
+                self._log(f"  🔧 Calling tool: {tool_name}({action.arguments})")
 
+            output = runner(args)
             output_str = str(output)
-            self._log(f"  📤 Tool result: {output_str[:200]}{'...' if len(output_str) > 200 else ''}")
+            if self.verbosity >= 1:
+                self._log(f"  📤 Tool result: {output_str[:200]}{'...' if len(output_str) > 200 else ''}")
             return StepResult(tool_name=tool_name, output=output_str, is_final=False)
 
         except Exception as e:
@@ -499,27 +1012,31 @@ class CodeAgent:
         On parse failure (e.g. LLM outputs plain text instead of JSON), injects
         a format correction into the conversation and retries via respond() —
         since the original message is already in kbench's history, calling
-        prompt() again would duplicate it.
+        prompt() again would duplicate it.  Transient provider errors (rate
+        limits, timeouts, 5xx) back off exponentially instead; permanent ones
+        stop immediately.
         """
+        self._track_turn(message)
+        if self._cache_enabled:
+            cached = self._cache_lookup()
+            if cached is not None:
+                import kaggle_benchmarks as kbench
+
+                kbench.user.send(message)
+                return self._replay_step(cached)
         for attempt in range(retries):
+            if attempt > 0:
+                self._flush_observations()
             try:
                 if attempt == 0:
                     result = self.model.prompt(message, schema=AgentReActStep)
                 else:
                     # Message already sent; just ask the LLM to respond again
                     result = self.model.respond(schema=AgentReActStep)
-                if isinstance(result, AgentReActStep):
-                    return result
-                if hasattr(result, "content"):
-                    return result.content
-                return result
+                return self._store_step(self._unwrap_step(result))
             except Exception as e:
-                # Commented out: kbench exception includes full Input Value (raw LLM text) → very noisy.
-                # _inject_format_correction already handles feedback via tool_actor.send.
-                # self._log(f"  ⚠️  llm.prompt() attempt {attempt+1}/{retries} failed: {e}")
-                self._log(f"  ⚠️  llm.prompt() attempt {attempt+1}/{retries} failed: response parse error")
-                if attempt < retries - 1:
-                    self._inject_format_correction()
+                if not self._handle_llm_error("llm.prompt()", e, attempt, retries):
+                    break
         return None
 
     def _safe_respond(self, retries: int = 3) -> Optional[AgentReActStep]:
@@ -527,25 +1044,126 @@ class CodeAgent:
 
         On parse failure, injects a JSON format correction into the conversation
         before retrying so the LLM sees its mistake and corrects the format,
-        rather than repeating the same plain-text response.
+        rather than repeating the same plain-text response.  Transient and
+        permanent provider errors are handled as in ``_safe_prompt``.
         """
         for attempt in range(retries):
+            self._flush_observations()
+            if self._cache_enabled:
+                cached = self._cache_lookup()
+                if cached is not None:
+                    return self._replay_step(cached)
             try:
                 result = self.model.respond(schema=AgentReActStep)
-                if isinstance(result, AgentReActStep):
-                    return result
-                if hasattr(result, "content"):
-                    return result.content
-                return result
+                return self._store_step(self._unwrap_step(result))
             except Exception as e:
-                # Commented out: kbench exception includes full Input Value (raw LLM text) → very noisy.
-                # _inject_format_correction already handles feedback via tool_actor.send.
-                # self._log(f"  ⚠️  llm.respond() attempt {attempt+1}/{retries} failed: {e}")
-                self._log(f"  ⚠️  llm.respond() attempt {attempt+1}/{retries} failed: response parse error")
-                if attempt < retries - 1:
-                    self._inject_format_correction()
+                if not self._handle_llm_error("llm.respond()", e, attempt, retries):
+                    break
         return None
 
+    # ---- response cache ---------------------------------------------------
+
+    def _reset_transcript(self, system_prompt: str) -> None:
+        """Start a new transcript hash for a chat holding only ``system_prompt``.
+
+        Seeded with the model's identity, so a ``response_cache`` shared by
+        agents on different models never replays one model's steps as
+        another's.
+        """
+        model_id = getattr(self.model, "name", None) or repr(self.model)
+        self._transcript_key = ""
+        self._advance_transcript(str(model_id))
+        self._advance_transcript(system_prompt)
+
+    def _advance_transcript(self, message: str) -> None:
+        """Fold one chat turn into the running transcript hash."""
+        self._transcript_key = hashlib.blake2b(
+            f"{self._transcript_key}\x00{message}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _track_turn(self, message: str) -> None:
+        """Account one chat turn: transcript hash (cache) and token budget."""
+        if self._cache_enabled:
+            self._advance_transcript(message)
+        self.memory.add_text(message)
+
+    def _cache_lookup(self) -> Optional[AgentReActStep]:
+        """Return the cached step for the current transcript, if any."""
+        cached = self.response_cache.get(f"{self._transcript_key}:{AgentReActStep.__name__}")
+        if cached is None:
+            return None
+        try:
+            return AgentReActStep.model_validate_json(cached)
+        except Exception:
+            return None  # stale/corrupt entry — fall through to the LLM
+
+    def _store_step(self, step: AgentReActStep) -> AgentReActStep:
+        """Store ``step`` under the current transcript, then track it as a turn."""
+        if self._cache_enabled or self.memory.compress_token_budget:
+            payload = step.get_payload()
+            if self._cache_enabled:
+                self.response_cache[f"{self._transcript_key}:{AgentReActStep.__name__}"] = payload
+            self._track_turn(payload)
+        return step
+
+    def _replay_step(self, step: AgentReActStep) -> AgentReActStep:
+        """Append a cached step to the chat as an assistant turn, skipping the LLM.
+
+        The turn is sent so later respond() calls see the same history the
+        original run did.
+        """
+        if self._replay_actor is None:
+            from kaggle_benchmarks import actors as kbench_actors
+
+            self._replay_actor = kbench_actors.Actor(
+                name=getattr(self.model, "name", "LLM"),
+                role="assistant",
+                avatar="♻️",
+            )
+        self._replay_actor.send(step)
+        self._log("  ♻️  LLM step served from response_cache")
+        self._track_turn(step.get_payload())
+        return step
+
+    def _unwrap_step(self, result: Any) -> AgentReActStep:
+        """Return the AgentReActStep from an LLM call result.
+
+        Depending on the kbench version, prompt()/respond() return either the
+        parsed schema object or a Message wrapping it in ``.content``.  That
+        never changes within a run, so the first result is probed once and the
+        outcome cached in ``_llm_returns_message``.
+        """
+        if self._llm_returns_message:
+            return result.content
+        if self._llm_returns_message is False:
+            return result
+        content = getattr(result, "content", result)
+        self._llm_returns_message = content is not result
+        return content
+
+    def _handle_llm_error(self, call: str, exc: Exception, attempt: int, retries: int) -> bool:
+        """Log a failed LLM call and prepare the next attempt.
+
+        Returns ``False`` when retrying is pointless (permanent error).
+        Transient errors back off before the next attempt; parse errors get a
+        format correction injected instead, so the LLM sees its mistake.
+        """
+        kind = _classify_llm_error(exc)
+        if kind == "permanent":
+            self._log(f"  ❌ {call} failed: {type(exc).__name__} — not retrying")
+            return False
+        if kind == "transient":
+            self._log(f"  ⚠️  {call} attempt {attempt+1}/{retries} failed: {type(exc).__name__} — backing off")
+            if attempt < retries - 1:
+                _sleep_backoff(attempt)
+            return True
+        # Not logging {exc}: kbench exception includes full Input Value (raw LLM text) → very noisy.
+        # _inject_format_correction already handles feedback via tool_actor.send.
+        self._log(f"  ⚠️  {call} attempt {attempt+1}/{retries} failed: response parse error")
+        if attempt < retries - 1:
+            self._inject_format_correction()
+        return True
+
     # ---- format-correction helper ----------------------------------------
 
     _FORMAT_CORRECTION = (
@@ -557,16 +1175,63 @@ class CodeAgent:
     )
 
     def _inject_format_correction(self) -> None:
-        """Push a JSON-format reminder into the active kbench conversation.
+        """Queue a JSON-format reminder for the active kbench conversation.
 
         Called between retry attempts when the LLM outputs plain text instead
-        of the required JSON schema.  The correction appears as a tool
+        of the required JSON schema.  The correction is flushed as a tool
         observation so the LLM sees it in the next respond() call.
         """
-        try:
-            self.tool_actor.send(self._FORMAT_CORRECTION)
-        except Exception:
-            pass  # best-effort; don't let a send failure mask the real error
+        self._pending_observations.append(self._FORMAT_CORRECTION)
+
+    # ---- observation batching ---------------------------------------------
+
+    @property
+    def tool_actor(self) -> Any:
+        """Actor that injects tool observations back into chat history.
+
+        Created once per agent, on first use, with role="assistant" so the LLM
+        sees it as a peer turn rather than a user prompt.
+        """
+        if self._tool_actor is None:
+            from kaggle_benchmarks import actors as kbench_actors
+
+            self._tool_actor = kbench_actors.Actor(
+                name="Tool",
+                role="assistant",
+                avatar="🔧",
+            )
+        return self._tool_actor
+
+    _OBSERVATION_SEPARATOR = "\n\n---\n\n"
+
+    def _format_observation(self, result: StepResult) -> str:
+        """Render a tool result as an observation, capped at max_observation_chars.
+
+        The full output stays in the step history; only the copy fed back to
+        the LLM is truncated.  Built with a single ``str.join`` over the parts.
+        """
+        output = result.output
+        limit = self.max_observation_chars
+        if limit and len(output) > limit:
+            return "".join((
+                "Observation from '", result.tool_name, "':\n",
+                output[:limit], "\n...[truncated]",
+            ))
+        return "".join(("Observation from '", result.tool_name, "':\n", output))
+
+    def _flush_observations(self) -> None:
+        """Send all queued observations as a single tool_actor turn.
+
+        Each ``tool_actor.send()`` appends a separate turn to kbench's history,
+        so coalescing everything produced since the last LLM call (parallel
+        tool results, format corrections) keeps it to one append per turn.
+        """
+        if not self._pending_observations:
+            return
+        message = self._OBSERVATION_SEPARATOR.join(self._pending_observations)
+        self._pending_observations.clear()
+        self.tool_actor.send(message)
+        self._track_turn(message)
 
     # ------------------------------------------------------------------
     # Logging
@@ -576,13 +1241,33 @@ class CodeAgent:
         """Short bracketed prefix identifying this agent in log output."""
         return f"[{self.name}]"
 
-    def _log(self, msg: str) -> None:
-        if self.verbosity >= 1:
-            print(f"{self._tag} {msg}")
+    @property
+    def verbosity(self) -> int:
+        return self._verbosity
 
-    def _log_step(self, i: int, step: AgentReActStep) -> None:
-        if self.verbosity >= 1:
-            print(f"\n{self._tag} --- Step {i+1} ---")
-            if self.verbosity >= 2 and step.thought:
-                print(f"{self._tag}   💭 Thought: {step.thought}")
-            print(f"{self._tag}   🎯 Action:  {step.action.name}({step.action.arguments})")
\ No newline at end of file
+    @verbosity.setter
+    def verbosity(self, level: int) -> None:
+        """Set the level and rebind the log methods.
+
+        At level 0 ``_log``/``_log_step`` become no-ops bound on the instance,
+        so silent agents skip the level check on every call.  Call sites with
+        non-trivial f-strings also guard on ``self.verbosity`` so the message
+        is never formatted just to be discarded.
+        """
+        self._verbosity = level
+        if level >= 1:
+            self._log = self._log_impl
+            self._log_step = self._log_step_impl
+        else:
+            self._log = _noop
+            self._log_step = _noop
+
+    def _log_impl(self, msg: str) -> None:
+        print(f"{self._tag} {msg}")
+
+    def _log_step_impl(self, i: int, step: AgentReActStep) -> None:
+        print(f"\n{self._tag} --- Step {i+1} ---")
+        if self._verbosity >= 2 and step.thought:
+            print(f"{self._tag}   💭 Thought: {step.thought}")
+        for action in step.actions:
+            print(f"{self._tag}   🎯 Action:  {action.name}({action.arguments})")
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+kagentic/batch.py
+---------------
+Concurrent fan-out of many tasks over fresh CodeAgents.
+
+Evaluating a benchmark sweep as ``for q in questions: agent.run(q)`` pays
+every run's LLM latency in sequence.  ``arun_many`` runs them concurrently
+instead, behind:
+
+  - an ``asyncio.Semaphore`` bounding how many runs are in flight, and
+  - an optional rate limiter spacing out run starts (``rate_limit_rpm``).
+
+Each task gets its own agent from ``agent_factory`` — an agent's step
+history, memory and observation queue belong to one run at a time.  The same
+holds for managed workers: the factory must build new ``managed_agents`` for
+every manager rather than close over shared ones.
+
+Usage (top-level ``await`` works in Kaggle / Jupyter notebooks)::
+
+    answers = await arun_many(
+        lambda: CodeAgent(tools=[WebSearchTool()], model=kbench.llm),
+        questions,
+        max_concurrency=8,
+    )
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from kagentic.agent import CodeAgent
+
+
+class _RateLimiter:
+    """Spaces ``acquire()`` calls at least ``60 / rpm`` seconds apart."""
+
+    def __init__(self, rpm: float):
+        self._interval = 60.0 / rpm
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now += wait
+            self._next_at = now + self._interval
+
+
+async def arun_many(
+    agent_factory: Callable[[], "CodeAgent"],
+    tasks: Sequence[str],
+    max_concurrency: int = 10,
+    rate_limit_rpm: Optional[float] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Any]:
+    """
+    Run every task on a fresh agent, concurrently, and return the results.
+
+    Args:
+        agent_factory:   Zero-argument callable returning a new ``CodeAgent``
+                         (with new ``managed_agents``, if it has any).
+        tasks:           Task strings, one agent run each.
+        max_concurrency: Maximum number of runs in flight at once.
+        rate_limit_rpm:  Optional cap on agent runs *started* per minute.
+        on_progress:     Optional ``callback(done, total)`` called as each run
+                         finishes (in completion order).
+
+    Returns:
+        One entry per task, in input order: the run's result, or the
+        exception it raised (failures do not cancel the other runs).
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = _RateLimiter(rate_limit_rpm) if rate_limit_rpm else None
+    total = len(tasks)
+    done = 0
+
+    async def _run_one(task: str) -> Any:
+        nonlocal done
+        async with sem:
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                with agent_factory() as agent:
+                    return await agent.arun(task)
+            finally:
+                done += 1
+                if on_progress is not None:
+                    on_progress(done, total)
+
+    return await asyncio.gather(*(_run_one(t) for t in tasks), return_exceptions=True)
@@ -11,9 +11,33 @@ AgentMemory's two jobs:
      sends a plain summary request to the LLM (the chat itself already
      carries full context, so no step log is needed) and opens a fresh
      kbench.chats.new() seeded with that summary.
+
+With ``compress_strategy="structured"`` the summary is built in two stages
+instead:
+  - Observer  (no LLM): observe() renders the window's step records as a
+    compact, step-numbered observation log.
+  - Reflector (one LLM call): the agent sends build_reflector_prompt() in a
+    throwaway chat with schema=CompressedContext, and
+    format_compressed_context() renders the result as the seed text.
+
+With ``compress_strategy="compact"`` no LLM is involved: compact_verbatim()
+drops low-signal lines from the window's step records and keeps the rest
+byte-identical, so exact paths, numbers and URLs survive compression.
+
+With ``compress_strategy="focus"`` only the older steps of a window are
+summarised: score_relevance() filters them, the agent makes one LLM call
+with build_focus_prompt() and appends the result to ``knowledge_block``,
+and format_focus_context() seeds the next window with that block plus the
+last KEEP_RECENT steps verbatim.  ``"sliding_window"`` keeps only those
+recent steps.
 """
 from __future__ import annotations
 
+import re
+from typing import Any, Iterable, List, Optional
+
+from kagentic.tokens import estimate_tokens
+
 
 class AgentMemory:
     """
@@ -35,14 +59,68 @@ class AgentMemory:
         "important context the next session should know about."
     )
 
-    def __init__(self, compress_threshold: int = 0):
+    REFLECTOR_PROMPT = (
+        "You are compressing the working memory of an agent that is still solving "
+        "a task. Below are the task and a log of every step taken so far. "
+        "Distil them into the required schema: the goal, the facts learned "
+        "(keep exact names, numbers, URLs and file paths), the attempts that "
+        "failed and why, and the questions still open. Drop everything else."
+    )
+
+    # Per-step tool output cap inside the observer log; the reflector only
+    # needs enough of each output to extract its facts.
+    OBSERVATION_CHARS = 2000
+
+    # Lines compact_verbatim() always drops: blank lines, raw HTTP status and
+    # header lines, Python traceback scaffolding (the final exception line is
+    # kept) and long base64 / hex blobs.
+    _NOISE_LINE = re.compile(
+        r"^\s*$"
+        r"|^HTTP/\d(?:\.\d)? \d{3}"
+        r"|^(?:content-type|content-length|cache-control|set-cookie|date|server"
+        r"|connection|etag|expires|last-modified|vary|x-[\w-]+):\s"
+        r"|^Traceback \(most recent call last\):"
+        r"|^\s+File \".*\", line \d+"
+        r"|^\s*[\^~]+\s*$"
+        r"|^\s*[A-Za-z0-9+/=]{200,}\s*$",
+        re.IGNORECASE,
+    )
+    # Number of most recent steps the compact, focus and sliding_window
+    # strategies carry over with a larger budget than older steps.
+    KEEP_RECENT = 3
+
+    FOCUS_PROMPT = (
+        "You are condensing the older part of an agent's working memory. Below "
+        "are the task and the older steps taken so far. Write a short list of "
+        "the facts they established (keep exact names, numbers, URLs and file "
+        "paths) and the approaches that failed. Do not describe recent steps "
+        "or plan next actions."
+    )
+    # Older steps scoring below this are dropped by focus compression instead
+    # of being summarised.
+    FOCUS_MIN_SCORE = 0.25
+    # Numbers, URLs and path-like tokens: cheap markers of a factual output.
+    _SIGNAL = re.compile(r"\d|https?://|\w/\w")
+
+    def __init__(self, compress_threshold: int = 0, compress_token_budget: int = 0):
         """
         Args:
             compress_threshold: After this many steps, should_compress() returns
                 True. Set to 0 (default) to disable auto-compression.
+            compress_token_budget: should_compress() also returns True once the
+                text recorded via add_text() in this window reaches this many
+                estimated tokens (see ``kagentic.tokens``). 0 (default) = off.
         """
         self.compress_threshold = compress_threshold
+        self.compress_token_budget = compress_token_budget
         self._step_count: int = 0
+        self._token_count: int = 0
+        # Step count at which should_compress() next fires (-1 = never);
+        # replaces a modulo on every step.
+        self._next_compress_at: int = compress_threshold if compress_threshold > 0 else -1
+        # Focus-compression summaries of older steps; persists across the
+        # windows of one run (the agent clears it at the start of run()).
+        self.knowledge_block: List[str] = []
 
     # ------------------------------------------------------------------
     # Step counting
@@ -50,29 +128,44 @@ class AgentMemory:
     def increment(self) -> None:
         """Record that one ReAct step completed."""
         self._step_count += 1
+        # Past a trigger point without a reset (the agent did not compress):
+        # move to the next multiple, as the old modulo check did.
+        if self._step_count > self._next_compress_at > 0:
+            self._next_compress_at += self.compress_threshold
 
     @property
     def step_count(self) -> int:
         return self._step_count
 
+    def add_text(self, text: str) -> None:
+        """Record a chat turn's text against the token budget (no-op when off)."""
+        if self.compress_token_budget > 0:
+            self._token_count += estimate_tokens(text)
+
+    @property
+    def token_count(self) -> int:
+        return self._token_count
+
     def reset(self) -> None:
         """Reset the step counter after a compression cycle.
 
         Must be called by the agent after it captures the summary and before
         opening the next kbench.chats.new() window.  Without this reset,
         should_compress() would fire again on the very first step of the new
-        window (because the old count still satisfies the modulo check).
+        window (because the old count would still be at the trigger point).
         """
         self._step_count = 0
+        self._token_count = 0
+        self._next_compress_at = self.compress_threshold if self.compress_threshold > 0 else -1
 
     # ------------------------------------------------------------------
     # Context compression
     # ------------------------------------------------------------------
     def should_compress(self) -> bool:
         """Return True when it's time to compress the orchestrator chat."""
-        if self.compress_threshold <= 0:
-            return False
-        return self._step_count > 0 and self._step_count % self.compress_threshold == 0
+        if self._step_count == self._next_compress_at:
+            return True
+        return 0 < self.compress_token_budget <= self._token_count
 
     def format_summary_as_context(self, summary: str) -> str:
         """Wrap summary for use as the first user message in a new chat."""
@@ -83,8 +176,107 @@ class AgentMemory:
             "Continue the task from where we left off."
         )
 
+    # ------------------------------------------------------------------
+    # Structured (observer / reflector) compression
+    # ------------------------------------------------------------------
+    def observe(self, records: Iterable[Any]) -> str:
+        """Stage 1: render step records as a step-numbered observation log.
+
+        ``records`` are ``StepRecord`` entries.  Pure templating, no LLM call.
+        """
+        limit = self.OBSERVATION_CHARS
+        lines = []
+        for r in records:
+            output = r.output if len(r.output) <= limit else r.output[:limit] + " …"
+            thought = f" (thought: {r.thought})" if r.thought else ""
+            lines.append(f"[step {r.step_idx + 1}] {r.tool_name}{thought}\n  → {output}")
+        return "\n".join(lines) if lines else "(no steps recorded)"
+
+    def compact_verbatim(self, records: Iterable[Any], recent_chars: Optional[int] = None) -> List[str]:
+        """Prune step records to their high-signal lines, without an LLM.
+
+        Each ``StepRecord`` contributes a ``[step N] tool`` header and its
+        output lines minus those matching ``_NOISE_LINE``, cut to whole lines
+        totalling at most ``OBSERVATION_CHARS`` — or ``recent_chars`` (default
+        ``OBSERVATION_CHARS``) for the last ``KEEP_RECENT`` steps, whose
+        stored outputs are otherwise uncapped.  Surviving lines are never
+        rewritten.
+        """
+        records = list(records)
+        noise = self._NOISE_LINE.match
+        old_until = len(records) - self.KEEP_RECENT
+        if recent_chars is None:
+            recent_chars = self.OBSERVATION_CHARS
+        lines: List[str] = []
+        for i, r in enumerate(records):
+            thought = f" (thought: {r.thought})" if r.thought else ""
+            lines.append(f"[step {r.step_idx + 1}] {r.tool_name}{thought}")
+            budget = self.OBSERVATION_CHARS if i < old_until else recent_chars
+            for line in r.output.splitlines():
+                if noise(line):
+                    continue
+                budget -= len(line)
+                if budget < 0:
+                    lines.append("  …")
+                    break
+                lines.append(line)
+        return lines or ["(no steps recorded)"]
+
+    # ------------------------------------------------------------------
+    # Focus compression
+    # ------------------------------------------------------------------
+    def score_relevance(self, record: Any, age: int) -> float:
+        """Cheap relevance score for a ``StepRecord`` that is ``age`` steps old.
+
+        Halves with every step of age; a final answer adds 1.0 and an output
+        containing numbers, URLs or paths adds 0.5.
+        """
+        score = 0.5 ** age
+        if record.is_final:
+            score += 1.0
+        if self._SIGNAL.search(record.output):
+            score += 0.5
+        return score
+
+    def build_focus_prompt(self, task_prompt: str, observations: str) -> str:
+        """Input of the single LLM call that condenses the older steps."""
+        return (
+            f"{self.FOCUS_PROMPT}\n\n"
+            f"=== TASK ===\n{task_prompt.strip()}\n\n"
+            f"=== OLDER STEPS ===\n{observations}"
+        )
+
+    def format_focus_context(self, recent: Iterable[Any]) -> str:
+        """Seed text for the next window: knowledge block + recent steps verbatim."""
+        knowledge = "\n\n".join(self.knowledge_block) or "(none yet)"
+        return f"Knowledge so far:\n{knowledge}\n\nRecent steps:\n{self.observe(recent)}"
+
+    def build_reflector_prompt(self, task_prompt: str, observations: str) -> str:
+        """Stage 2 input: the single message sent to the reflector LLM call."""
+        return (
+            f"{self.REFLECTOR_PROMPT}\n\n"
+            f"=== TASK ===\n{task_prompt.strip()}\n\n"
+            f"=== STEP LOG ===\n{observations}"
+        )
+
+    def format_compressed_context(self, ctx: Any) -> str:
+        """Render a ``CompressedContext`` as the summary text for the next window."""
+        def _bullets(items: Iterable[str]) -> str:
+            return "\n".join(f"- {item}" for item in items) or "- (none)"
+
+        failed = _bullets(f"{a.action} — {a.reason}" for a in ctx.failed_attempts)
+        return (
+            f"Goal: {ctx.goal}\n"
+            f"Facts learned:\n{_bullets(ctx.facts_learned)}\n"
+            f"Failed attempts:\n{failed}\n"
+            f"Open questions:\n{_bullets(ctx.open_questions)}"
+        )
+
     # ------------------------------------------------------------------
     # Representation
     # ------------------------------------------------------------------
     def __repr__(self) -> str:
-        return f"AgentMemory(steps={self.step_count}, compress_threshold={self.compress_threshold})"
\ No newline at end of file
+        return (
+            f"AgentMemory(steps={self.step_count}, compress_threshold={self.compress_threshold}, "
+            f"tokens={self._token_count}, compress_token_budget={self.compress_token_budget})"
+        )
\ No newline at end of file
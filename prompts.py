@@ -12,6 +12,7 @@ Keeping this in one place makes it easy to tune for different LLMs.
 """
 from __future__ import annotations
 
+import functools
 import json
 from typing import Any, List, Optional, TYPE_CHECKING
 
@@ -32,13 +33,14 @@ Every response MUST be a valid JSON object matching this schema:
   "action": {{
     "name": "<name of the tool to call>",
     "arguments": {{<arguments as a real JSON object — no escaping, no quotes around the object>}}
-  }}
+  }},
+  "parallel_actions": [<optional: extra independent tool calls, same shape as "action">]
 }}
 
 ## Rules
 1. Think step-by-step in "thought" before choosing a tool.
-2. Call exactly ONE tool per response.
-3. When you have a complete answer, use action.name = "final_answer" and pass your answer fields directly in action.arguments as a JSON object.
+2. Call ONE tool per response in "action". If other calls are fully independent of it (e.g. several searches), you may add them to the optional "parallel_actions" list — they run concurrently and you receive every observation together.
+3. When you have a complete answer, use action.name = "final_answer" and pass your answer fields directly in action.arguments as a JSON object. final_answer must always be the only call in its response.
 4. NEVER output plain text outside of the JSON structure.
 5. Use the tool results (provided as "Observation:") to decide your next step.
 6. When a **Structured Output Schema** section is present below, spread ALL schema fields directly inside action.arguments — do not nest them under an extra key.
@@ -53,6 +55,11 @@ Every response MUST be a valid JSON object matching this schema:
 - If a tool call fails, read the error carefully and try a corrected call.
 """
 
+# Literal halves around the {tool_descriptions} slot (braces unescaped).
+_SYSTEM_PROMPT_HEAD, _SYSTEM_PROMPT_TAIL = (
+    _SYSTEM_PROMPT_TEMPLATE.replace("{{", "{").replace("}}", "}").split("{tool_descriptions}")
+)
+
 # Shown inside the tool descriptions block
 _TOOL_BLOCK_TEMPLATE = """\
 ### {name}
@@ -80,20 +87,31 @@ Remember: respond ONLY with a JSON object matching the required schema.
 # Builder helpers
 # ---------------------------------------------------------------------------
 def _format_tool(tool: "Tool") -> str:
-    """Render a single tool into its prose description block."""
-    param_lines = []
-    for param_name, tool_input in tool.inputs.items():
-        param_lines.append(
-            _PARAM_LINE.format(
-                name=param_name,
-                type=tool_input.type,
-                required_str="required" if tool_input.required else "optional",
-                description=tool_input.description,
-            )
+    """Render a single tool into its prose description block.
+
+    Keyed on the tool's rendered fields rather than the instance, so a tool
+    shared by many agents (e.g. an ``arun_many`` fan-out) or an identical
+    FinalAnswerTool per agent renders once, while a tool whose description
+    is patched after construction still re-renders.  ``ToolInput`` is frozen
+    and hashable, so the ``inputs`` items form the key directly.
+    """
+    return _render_tool(tool.name, tool.description, tuple(tool.inputs.items()))
+
+
+@functools.lru_cache(maxsize=256)
+def _render_tool(name: str, description: str, params: tuple) -> str:
+    param_lines = [
+        _PARAM_LINE.format(
+            name=param_name,
+            type=tool_input.type,
+            required_str="required" if tool_input.required else "optional",
+            description=tool_input.description,
         )
+        for param_name, tool_input in params
+    ]
     return _TOOL_BLOCK_TEMPLATE.format(
-        name=tool.name,
-        description=tool.description,
+        name=name,
+        description=description,
         params="\n".join(param_lines) if param_lines else "  (no parameters)",
     )
 
@@ -116,20 +134,28 @@ def build_system_prompt(
 
     Returns:
         A complete system-instruction string ready to pass to kbench.chats.new().
+
+    The output is deterministic for the same inputs, so keep
+    ``additional_instructions`` stable across a batch of runs: providers only
+    reuse their prompt (prefix) cache for a byte-identical system prompt.
     """
-    tool_descriptions = "\n".join(_format_tool(t) for t in tools)
-    prompt = _SYSTEM_PROMPT_TEMPLATE.format(tool_descriptions=tool_descriptions)
+    # One join over prebuilt pieces (template halves split once at import,
+    # memoized tool blocks) instead of format() plus repeated concatenation.
+    parts = [_SYSTEM_PROMPT_HEAD, "\n".join([_format_tool(t) for t in tools]), _SYSTEM_PROMPT_TAIL]
     if additional_instructions and additional_instructions.strip():
-        prompt += f"\n## Additional Instructions\n{additional_instructions.strip()}\n"
+        parts += ("\n## Additional Instructions\n", additional_instructions.strip(), "\n")
     if response_format is not None:
-        prompt += _build_response_format_section(response_format)
-    return prompt
+        parts.append(_build_response_format_section(response_format))
+    return "".join(parts)
 
 
+@functools.lru_cache(maxsize=32)
 def _build_response_format_section(model_cls: Any) -> str:
     """
     Build a section that tells the LLM the exact JSON schema it must output
     as a native JSON object spread directly inside ``action.arguments``.
+
+    Memoized per class — ``model_json_schema()`` is the costly part.
     """
     # Prefer Pydantic v2 model_json_schema(), fall back to v1 schema()
     if hasattr(model_cls, "model_json_schema"):
@@ -172,6 +198,7 @@ def _build_response_format_section(model_cls: Any) -> str:
     )
 
 
+@functools.lru_cache(maxsize=64)
 def build_task_prompt(task: str) -> str:
-    """Wrap a user task string as the first turn message."""
+    """Wrap a user task string as the first turn message (pure, memoized)."""
     return TASK_PROMPT_TEMPLATE.format(task=task)
@@ -14,20 +14,29 @@ Key trick (same as complemon/agent/schemas.py):
 Solution: nest ToolCall inside AgentReActStep so $defs is always present,
 exactly like complemon's AgentResponse + ToolCall design.
 """
+import functools as _functools
 import json as _json
-import re as _re
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
-try:
-    from json_repair import loads as _json_repair_loads
-except ImportError:
-    _json_repair_loads = None  # type: ignore[assignment]
+
+@_functools.lru_cache(maxsize=1)
+def get_json_repair_loads() -> Optional[Callable[[str], Any]]:
+    """Return ``json_repair.loads``, importing it on first use (None if missing).
+
+    Every parse tries strict JSON first, so a run whose LLM output is always
+    well-formed never pays for importing json_repair.
+    """
+    try:
+        from json_repair import loads
+    except ImportError:
+        return None
+    return loads
 
 
 class ToolCall(BaseModel):
-    """A single tool invocation -- name + JSON-serialized argument string."""
+    """A single tool invocation -- name + arguments (a dict, or a JSON string)."""
     name: str = Field(
         description=(
             "Name of the tool to call. "
@@ -48,22 +57,55 @@ class ToolCall(BaseModel):
     @field_validator("arguments", mode="before")
     @classmethod
     def _coerce_arguments(cls, v: Any) -> Any:
-        """Normalize arguments to a compact JSON string for internal use.
+        """Normalize arguments for internal use.
 
         Accepts either:
-        - A native dict/list (preferred, no escaping needed) — serialized to JSON string.
+        - A native dict (preferred, no escaping needed) — kept as a dict, so
+          the agent uses it without a dumps/loads round-trip and the step is
+          echoed back to the LLM as a nested object, not an escaped string.
         - A JSON-encoded string — passed through as-is (json_repair handles malformed cases).
+        - A list (invalid, but tolerated) — serialized to a JSON string.
 
         This means the LLM can freely output arguments as a real JSON object
         (e.g. ``{"query": "hello", "topk": 3}``) without any backslash escaping,
         saving tokens and eliminating escape-related parse failures.
         """
-        if isinstance(v, (dict, list)):
+        if isinstance(v, list):
             return _json.dumps(v)
         return v
 
 
 
+class FailedAttempt(BaseModel):
+    """One approach that did not work, kept so the agent does not repeat it."""
+    action: str = Field(description="What was tried (tool + key arguments).")
+    reason: str = Field(description="Why it failed or what it returned.")
+
+
+class CompressedContext(BaseModel):
+    """
+    Structured working-memory snapshot produced by the reflector stage of
+    ``compress_strategy="structured"`` (see memory.py).
+
+    ``failed_attempts`` is a nested model on purpose: like AgentReActStep it
+    keeps ``$defs`` in the JSON schema so kbench uses its text-based JSON
+    instructions, which work on every Kaggle model.
+    """
+    goal: str = Field(description="The task goal, restated in one sentence.")
+    facts_learned: List[str] = Field(
+        default_factory=list,
+        description="Concrete facts established so far (exact values, names, paths, URLs).",
+    )
+    failed_attempts: List[FailedAttempt] = Field(
+        default_factory=list,
+        description="Approaches that failed, so they are not retried.",
+    )
+    open_questions: List[str] = Field(
+        default_factory=list,
+        description="What still has to be found out or done.",
+    )
+
+
 class AgentReActStep(BaseModel):
     """
     One step in the ReAct loop.
@@ -79,6 +121,22 @@ class AgentReActStep(BaseModel):
     action: ToolCall = Field(
         description="The tool call to execute this step."
     )
+    parallel_actions: List[ToolCall] = Field(
+        default_factory=list,
+        description=(
+            "Optional extra tool calls that are fully independent of `action` "
+            "(e.g. several searches at once). They run concurrently with `action`. "
+            "Leave empty when calls depend on each other. Never put final_answer here."
+        ),
+    )
+
+    # Memoized get_payload() JSON (private attrs are excluded from the schema).
+    _payload: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def actions(self) -> List[ToolCall]:
+        """All tool calls requested this step: ``action`` first, then ``parallel_actions``."""
+        return [self.action, *self.parallel_actions]
 
     # ------------------------------------------------------------------
     # Robust JSON parsing (called by kbench on every raw LLM response)
@@ -119,6 +177,7 @@ class AgentReActStep(BaseModel):
             pass
 
         # Strategy 2: json_repair for malformed-but-close JSON
+        _json_repair_loads = get_json_repair_loads()
         if _json_repair_loads is not None:
             try:
                 data = _json_repair_loads(raw)
@@ -130,9 +189,9 @@ class AgentReActStep(BaseModel):
         # Strategy 3: extract JSON block from plain-text response
         try:
             # Find the first '{' that is followed (somewhere) by an "action" key.
-            match = _re.search(r'\{', raw)
-            if match:
-                candidate = raw[match.start():]
+            start = raw.find("{")
+            if start != -1:
+                candidate = raw[start:]
                 if _json_repair_loads is not None:
                     data = _json_repair_loads(candidate)
                 else:
@@ -157,19 +216,23 @@ class AgentReActStep(BaseModel):
         that would otherwise appear when the LLM response message is
         rendered in the panel.
         """
-        lines = []
-        if self.thought:
-            lines.append(f"💭 **Thought:** {self.thought}")
-        lines.append(
-            f"🎯 **Action:** `{self.action.name}` &nbsp;·&nbsp; `{self.action.arguments}`"
+        rendered = "\n\n".join(
+            f"🎯 **Action:** `{action.name}` &nbsp;·&nbsp; `{action.arguments}`"
+            for action in self.actions
         )
-        return "\n\n".join(lines)
+        if not self.thought:
+            return rendered
+        return f"💭 **Thought:** {self.thought}\n\n{rendered}"
 
     def get_payload(self) -> str:
         """Serialize back to JSON for the LLM's next turn.
 
         kbench's ``Message.payload`` property calls ``get_payload()`` if
         present, so the LLM always receives the original JSON rather than
-        the markdown repr.
+        the markdown repr.  The history is re-rendered on every LLM call, so
+        the JSON is built once per step and memoized (steps are never
+        mutated after parsing).
         """
-        return self.model_dump_json()
+        if self._payload is None:
+            self._payload = self.model_dump_json()
+        return self._payload
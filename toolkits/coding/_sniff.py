@@ -0,0 +1,17 @@
+SNIFF_BYTES = 4096
+
+# UTF-16 / UTF-32 byte-order marks: text, but not in an encoding the tools read.
+_WIDE_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+
+def looks_binary(path: str) -> bool:
+    """
+    Return True if the first ``SNIFF_BYTES`` of ``path`` contain a NUL byte
+    or the file starts with a UTF-16/UTF-32 byte-order mark.
+
+    Cheap pre-check so the text tools can reject binary files without
+    decoding them as UTF-8 first.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    return b'\x00' in head or head.startswith(_WIDE_BOMS)
@@ -1,7 +1,29 @@
+import itertools
 import os
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
+from ._sniff import looks_binary
+
+_CHUNK = 1 << 20
+
+
+def _count_lines(f) -> int:
+    """Count the lines of the open binary file ``f`` without decoding it.
+
+    Line breaks are ``\\n``, ``\\r\\n`` and lone ``\\r``, matching the text-mode
+    (universal newlines) read that slices the window.
+    """
+    total = 0
+    last = b''
+    for chunk in iter(lambda: f.read(_CHUNK), b''):
+        # memchr-backed counts, no per-line objects; a CRLF counts once.
+        total += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+        if last == b'\r' and chunk[:1] == b'\n':
+            total -= 1  # CRLF split across two chunks
+        last = chunk[-1:]
+    return total + (1 if last and last not in (b'\n', b'\r') else 0)
+
 
 class FileViewerTool(Tool):
     """
@@ -37,31 +59,36 @@ class FileViewerTool(Tool):
             return f"Error: '{file_path}' is not a file."
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-             return f"Error: File '{file_path}' appears to be a binary file or uses an unsupported encoding."
+            if looks_binary(file_path):
+                return f"Error: File '{file_path}' appears to be a binary file or uses an unsupported encoding."
+            # Count lines on the raw bytes for the header; only the requested
+            # window is ever decoded.
+            with open(file_path, 'rb') as f:
+                total_lines = _count_lines(f)
         except Exception as e:
             return f"Error opening file: {str(e)}"
-            
-        total_lines = len(lines)
+
         if total_lines == 0:
             return f"File '{file_path}' is empty."
             
         start_idx = max(0, start_line - 1)
-        
-        if end_line is None:
-            end_idx = total_lines
-        else:
-            end_idx = min(total_lines, end_line)
-            
+        end_idx = total_lines if end_line is None else min(total_lines, end_line)
+
         if start_idx >= total_lines:
             return f"Error: start_line ({start_line}) is beyond the end of the file ({total_lines} lines)."
             
         if start_idx >= end_idx:
             return f"Error: start_line ({start_line}) must be less than end_line ({end_line})."
             
-        content = "".join(lines[start_idx:end_idx])
+        # Stream the file and keep only the requested window, instead of
+        # materialising every line of a large file with readlines().
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = "".join(itertools.islice(f, start_idx, end_idx))
+        except UnicodeDecodeError:
+             return f"Error: File '{file_path}' appears to be a binary file or uses an unsupported encoding."
+        except Exception as e:
+            return f"Error opening file: {str(e)}"
         
         header = f"--- {os.path.basename(file_path)} (Lines {start_idx + 1}-{end_idx} of {total_lines}) ---\n"
         return header + content
@@ -1,8 +1,86 @@
+import bisect
+import itertools
+import mmap
 import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
+from ._sniff import looks_binary
+
+_EXTS = frozenset(('.py', '.txt', '.md'))
+_SKIP_DIRS = frozenset(('.git', '__pycache__', 'node_modules'))
+_WORKERS = 16
+
+
+def _iter_files(path):
+    """Recursively yield the paths of searchable files under ``path``."""
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _SKIP_DIRS:
+                yield from _iter_files(entry.path)
+        elif os.path.splitext(entry.name)[1] in _EXTS and entry.is_file():
+            yield entry.path
+
+
+def _compile_hyperscan(pattern: str, case_sensitive: bool):
+    """
+    Compile ``pattern`` into a Hyperscan database, or return ``None``.
+
+    Hyperscan is optional: when it is not installed, or the pattern uses
+    syntax it does not support (back-references, look-around, patterns that
+    can match the empty string), the caller falls back to ``re``.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    db = hyperscan.Database()
+    try:
+        db.compile(expressions=[pattern.encode('utf-8')], ids=[0], flags=[flags])
+    except Exception:
+        return None
+    return db
+
+
+def _re_lines(regex, filepath):
+    """Yield ``(line_number, line)`` for every line of ``filepath`` that ``regex`` matches."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f, 1):
+            if regex.search(line):
+                yield i, line
+
+
+def _hyperscan_lines(db, filepath):
+    """Yield ``(line_number, line)`` for every line of ``filepath`` with a match."""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            ends = []
+            db.scan(buf, match_event_handler=lambda _id, _from, to, _flags, _ctx: ends.append(to))
+            if not ends:
+                return
+            newlines = [m.start() for m in re.finditer(b'\n', buf)]
+            last = 0
+            for to in ends:
+                idx = bisect.bisect_left(newlines, to - 1)
+                if idx + 1 == last:
+                    continue  # Hyperscan reports every match end; one hit per line
+                last = idx + 1
+                start = newlines[idx - 1] + 1 if idx else 0
+                end = newlines[idx] if idx < len(newlines) else len(buf)
+                yield last, buf[start:end].decode('utf-8', errors='replace')
+
 
 class RegexSearchTool(Tool):
     """
@@ -36,6 +114,7 @@ class RegexSearchTool(Tool):
             regex = re.compile(pattern, flags)
         except re.error as e:
             return f"Error compiling regular expression: {str(e)}"
+        hs_db = _compile_hyperscan(pattern, case_sensitive)
 
         if not os.path.exists(path):
             return f"Error: Path '{path}' does not exist."
@@ -44,35 +123,46 @@ class RegexSearchTool(Tool):
         max_results = 50
 
         def search_file(filepath):
-            if len(results) >= max_results:
-                return
+            found = []
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if regex.search(line):
-                            results.append(f"{filepath}:{i}: {line.strip()}")
-                            if len(results) >= max_results:
-                                results.append(f"... Truncating at {max_results} results ...")
-                                break
+                if looks_binary(filepath):
+                    return found  # Skip binary files without decoding them
+                if hs_db is not None:
+                    matches = _hyperscan_lines(hs_db, filepath)
+                else:
+                    matches = _re_lines(regex, filepath)
+                for i, line in matches:
+                    found.append(f"{filepath}:{i}: {line.strip()}")
+                    if len(found) >= max_results:
+                        break
             except UnicodeDecodeError:
                 pass  # Skip binary files
             except Exception as e:
-                results.append(f"Error reading {filepath}: {str(e)}")
+                found.append(f"Error reading {filepath}: {str(e)}")
+            return found
 
         if os.path.isfile(path):
-            search_file(path)
+            files = iter([path])
         else:
-            for root, _, files in os.walk(path):
-                # Optionally filter out .git, __pycache__, node_modules etc if needed later
-                if any(x in root for x in [".git", "__pycache__", "node_modules"]):
-                    continue
-                for file in files:
-                    if file.endswith('.py') or file.endswith('.txt') or file.endswith('.md'):
-                        search_file(os.path.join(root, file))
-                    if len(results) >= max_results:
-                        break
+            files = _iter_files(path)
+
+        # Files are read concurrently (blocking I/O overlaps across threads),
+        # but results are consumed in walk order so the output is stable.
+        # Only a bounded window of files is in flight, and the walk advances
+        # as results are consumed, so it stops as soon as max_results is hit.
+        with ThreadPoolExecutor(max_workers=_WORKERS) as ex:
+            window = deque(ex.submit(search_file, fp) for fp in itertools.islice(files, 2 * _WORKERS))
+            while window:
+                results.extend(window.popleft().result())
                 if len(results) >= max_results:
+                    del results[max_results:]
+                    results.append(f"... Truncating at {max_results} results ...")
+                    for pending in window:
+                        pending.cancel()
                     break
+                fp = next(files, None)
+                if fp is not None:
+                    window.append(ex.submit(search_file, fp))
 
         if not results:
             return f"No matches found for pattern '{pattern}' in '{path}'."
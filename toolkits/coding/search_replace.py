@@ -1,7 +1,81 @@
+import contextlib
+import mmap
 import os
+import re
+import shutil
+import tempfile
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
+from ._sniff import looks_binary
+
+_CHUNK = 64 * 1024
+_BARE_LF = re.compile(rb'(?<!\r)\n')
+
+
+def _locate(f, old_string, new_string):
+    """
+    Find the first occurrence of ``old_string`` in the open binary file ``f``.
+
+    The file is memory-mapped, so only the pages up to the match (and, for
+    the occurrence count, the rest of the file) are ever touched, and nothing
+    is decoded.  Returns ``(start, end, replacement_bytes, occurrences)`` or
+    ``None`` if ``old_string`` does not occur.
+    """
+    needle = old_string.encode('utf-8')
+    replacement = new_string.encode('utf-8')
+    if os.fstat(f.fileno()).st_size == 0:
+        mapped = contextlib.nullcontext(b'')  # mmap refuses empty files
+    else:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mapped as data:
+        crlf = data.find(b'\r\n') >= 0
+        if crlf:
+            # CRLF file: the agent sees (and writes) plain '\n' newlines, so
+            # every inserted line gets the file's line ending.
+            replacement = _BARE_LF.sub(b'\r\n', replacement)
+        idx = data.find(needle)
+        if idx < 0 and crlf and b'\n' in needle:
+            needle = _BARE_LF.sub(b'\r\n', needle)
+            idx = data.find(needle)
+        if idx < 0:
+            return None
+        end = idx + len(needle)
+        # Count the remaining occurrences after the first hit only (non-overlapping, like str.count).
+        if not needle:
+            return idx, end, replacement, len(data) + 1
+        occurrences = 1
+        pos = data.find(needle, end)
+        while pos >= 0:
+            occurrences += 1
+            pos = data.find(needle, pos + len(needle))
+    return idx, end, replacement, occurrences
+
+
+def _copy_bytes(src, dst, n):
+    """Copy the next ``n`` bytes of ``src`` to ``dst`` in ``_CHUNK``-sized pieces."""
+    while n > 0:
+        chunk = src.read(min(n, _CHUNK))
+        if not chunk:
+            break
+        dst.write(chunk)
+        n -= len(chunk)
+
+
+def _rewrite_in_place(path, idx, end, replacement):
+    """Splice ``replacement`` over bytes ``[idx, end)`` of ``path`` in place.
+
+    Used for hard-linked files, where swapping in a new inode would detach
+    this path from its other links.
+    """
+    with open(path, 'r+b') as f:
+        f.seek(end)
+        tail = f.read()
+        f.seek(idx)
+        f.write(replacement)
+        f.write(tail)
+        f.truncate()
+
 
 class SearchAndReplaceTool(Tool):
     """
@@ -38,30 +112,48 @@ class SearchAndReplaceTool(Tool):
             return f"Error: '{file_path}' is not a file."
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            return f"Error: File '{file_path}' appears to be a binary file or uses an unsupported encoding."
+            if looks_binary(file_path):
+                return f"Error: File '{file_path}' appears to be a binary file or uses an unsupported encoding."
+            # Work on the raw bytes: no decode/encode round-trip, and the rest
+            # of the file (including its line endings) is copied back untouched.
+            with open(file_path, 'rb') as f:
+                located = _locate(f, old_string, new_string)
         except Exception as e:
             return f"Error opening file: {str(e)}"
-            
-        if old_string not in content:
+
+        if located is None:
             return "Error: The `old_string` was not found in the file. Make sure you matched the indentation, newlines, and whitespace EXACTLY as they appear in the file."
             
-        occurrences = content.count(old_string)
+        idx, end, replacement, occurrences = located
         if occurrences > 1:
             # We enforce replacing only the first occurrence to avoid destroying similar blocks of code by accident.
             # But we warn the agent so it knows.
-            content = content.replace(old_string, new_string, 1)
             msg = f"Replaced 1 occurrence of `old_string` successfully (Warning: `old_string` appeared {occurrences} times in the file; only the first was modified. If you meant to modify a different occurrence, add more context to `old_string` to make it unique.)"
         else:
-            content = content.replace(old_string, new_string)
             msg = "Successfully replaced the `old_string` with the `new_string`."
             
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated file behind.  The swap targets the real
+        # file behind any symlink, so the link itself is left intact.
+        target = os.path.realpath(file_path)
+        tmp_path = None
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if os.stat(target).st_nlink > 1:
+                _rewrite_in_place(target, idx, end, replacement)
+                return msg
+            with open(target, 'rb') as src, tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(target), delete=False, mode='wb'
+            ) as tmp:
+                tmp_path = tmp.name
+                _copy_bytes(src, tmp, idx)
+                tmp.write(replacement)
+                src.seek(end)
+                shutil.copyfileobj(src, tmp, _CHUNK)
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
         except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             return f"Error writing to file: {str(e)}"
             
         return msg
@@ -1,9 +1,69 @@
 import subprocess
 import os
+import selectors
+import time
 
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
+# Per-stream cap on captured output: agents only read the first few KB, and a
+# full test-suite run can print hundreds of MB.
+MAX_OUTPUT_BYTES = 64 * 1024
+
+
+def _collect(proc, timeout):
+    """
+    Drain ``proc``'s stdout/stderr until both close, keeping at most
+    ``MAX_OUTPUT_BYTES`` of each (the rest is read and discarded so the
+    process never blocks on a full pipe).
+
+    Returns ``(stdout, stderr)`` as ``(kept_bytes, dropped_count)`` pairs.
+    Kills the process and raises ``subprocess.TimeoutExpired`` on timeout
+    (``timeout=None`` waits indefinitely, like ``subprocess.run``).  Like
+    ``subprocess.run``, any other error (e.g. a non-numeric ``timeout``)
+    also kills and reaps the process before propagating.
+    """
+    kept = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    dropped = {proc.stdout: 0, proc.stderr: 0}
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with selectors.DefaultSelector() as sel:
+            for pipe in kept:
+                sel.register(pipe, selectors.EVENT_READ)
+            while sel.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 32 * 1024)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        continue
+                    buf = kept[key.fileobj]
+                    room = max(0, MAX_OUTPUT_BYTES - len(buf))
+                    buf += chunk[:room]
+                    dropped[key.fileobj] += max(0, len(chunk) - room)
+        proc.wait(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+    return (
+        (kept[proc.stdout], dropped[proc.stdout]),
+        (kept[proc.stderr], dropped[proc.stderr]),
+    )
+
+
+def _decode(stream):
+    data, dropped = stream
+    text = data.decode('utf-8', errors='replace')
+    if dropped:
+        text += f"\n... [truncated {dropped} more bytes] ..."
+    return text
+
 
 class ShellExecutionTool(Tool):
     """
@@ -35,23 +95,23 @@ class ShellExecutionTool(Tool):
         try:
             working_dir = cwd if cwd else os.getcwd()
             # We use shell=True to allow arbitrary bash-like commands
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command, 
                 shell=True, 
                 cwd=working_dir, 
-                text=True, 
-                capture_output=True, 
-                timeout=timeout
+                stdout=subprocess.PIPE, 
+                stderr=subprocess.PIPE
             )
+            stdout, stderr = map(_decode, _collect(proc, timeout))
             
             output = ""
-            if result.stdout:
-                output += f"STDOUT:\n{result.stdout}\n"
-            if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
+            if stdout:
+                output += f"STDOUT:\n{stdout}\n"
+            if stderr:
+                output += f"STDERR:\n{stderr}\n"
                 
-            if result.returncode != 0:
-                output = f"Command failed with exit code {result.returncode}.\n{output}"
+            if proc.returncode != 0:
+                output = f"Command failed with exit code {proc.returncode}.\n{output}"
             else:
                 output = f"Command succeeded.\n{output}"
                 
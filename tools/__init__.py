@@ -3,6 +3,7 @@ kagentic/tools/__init__.py
 """
 from kagentic.tools.agent_tool import AgentTool
 from kagentic.tools.base import Tool
+from kagentic.tools.compress_context import CompressContextTool
 from kagentic.tools.final_answer import FinalAnswerTool
 from kagentic.tools.python_runner import PythonCodeRunnerTool
 from kagentic.tools.web_browse import WebBrowseTool
@@ -11,6 +12,7 @@ from kagentic.tools.web_search import WebSearchTool
 __all__ = [
     "AgentTool",
     "Tool",
+    "CompressContextTool",
     "FinalAnswerTool",
     "PythonCodeRunnerTool",
     "WebBrowseTool",
@@ -0,0 +1,123 @@
+"""
+kagentic/tools/_http.py
+---------------------
+Shared HTTP session for the web tools.
+
+A bare ``requests.get()`` opens (and TLS-handshakes) a fresh connection on
+every call.  WebSearchTool and WebBrowseTool instead share one
+``requests.Session`` whose pooled adapter keeps connections alive per host,
+so chained search → browse → browse calls reuse them.  Transient failures
+(connect errors, 429, 5xx) are retried with exponential backoff by urllib3.
+
+Speculative prefetch: WebSearchTool(prefetch_top_k=N) hands its top result
+URLs to prefetch(), which starts background GETs; WebBrowseTool asks
+take_prefetched() before fetching, so the page download overlaps the LLM
+turn that picks the URL.  Entries live for PREFETCH_TTL seconds.
+
+Page bodies are streamed and capped at MAX_PAGE_BYTES: the browse tool
+returns at most 20k characters, so downloading (and parsing) a multi-MB page
+in full is wasted work.
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Optional, Tuple
+
+_session: Optional[Any] = None
+_lock = threading.Lock()
+
+MAX_PAGE_BYTES = 400_000
+PREFETCH_TTL = 60.0
+_PREFETCH_MAX = 32
+# url -> (started_at, Future[str] resolving to the page HTML)
+_prefetched: "OrderedDict[str, Tuple[float, Future]]" = OrderedDict()
+_prefetch_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_session() -> Any:
+    """Return the process-wide pooled ``requests.Session`` (created on first use).
+
+    Raises ImportError if ``requests`` is not installed — callers already
+    handle that to report the missing dependency.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "POST"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                _session = session
+    return _session
+
+
+def fetch_text(url: str, headers: dict, timeout: float = 15, max_bytes: int = MAX_PAGE_BYTES) -> str:
+    """GET ``url`` and return at most ``max_bytes`` of its body, decoded.
+
+    The body is streamed and the connection dropped once the cap is reached
+    (or the page's ``</main>`` has arrived — the browse tool extracts
+    ``<main>`` first, so nothing after it is used).
+    """
+    with get_session().get(url, headers=headers, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=16384):
+            buf += chunk
+            if len(buf) >= max_bytes:
+                break
+            if buf.find(b"</main>", max(0, len(buf) - len(chunk) - 6)) >= 0:
+                break
+        encoding = resp.encoding or "utf-8"
+    del buf[max_bytes:]
+    try:
+        return buf.decode(encoding, errors="replace")
+    except LookupError:  # unknown charset label from the server
+        return buf.decode("utf-8", errors="replace")
+
+
+def prefetch(urls: Iterable[str], headers: dict, timeout: float = 15) -> None:
+    """Start background GETs for ``urls`` (non-blocking; errors are kept in the future)."""
+    global _prefetch_pool
+    with _lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kagentic_prefetch")
+        now = time.monotonic()
+        for url in urls:
+            if url in _prefetched and now - _prefetched[url][0] < PREFETCH_TTL:
+                continue
+            _prefetched[url] = (now, _prefetch_pool.submit(fetch_text, url, headers, timeout))
+            _prefetched.move_to_end(url)
+        while len(_prefetched) > _PREFETCH_MAX:
+            _prefetched.popitem(last=False)
+
+
+def take_prefetched(url: str, timeout: float = 15) -> Optional[str]:
+    """Return the prefetched HTML for ``url``, or None (not prefetched, stale or failed).
+
+    Waits for an in-flight prefetch rather than starting a second request.
+    """
+    with _lock:
+        entry = _prefetched.pop(url, None)
+    if entry is None or time.monotonic() - entry[0] >= PREFETCH_TTL:
+        return None
+    try:
+        return entry[1].result(timeout=timeout)
+    except Exception:
+        return None
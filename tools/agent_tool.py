@@ -19,9 +19,15 @@ This means:
   - Call 2: Manager asks to refine -> worker sees its own previous reasoning
     and the original task, then refines accordingly
 
+Every call re-sends the whole history to the LLM, so a long-lived worker's
+cost grows quadratically with the number of calls.  ``max_history_calls``
+bounds it: once that many calls have accumulated, the chat is truncated to
+its system prompt and the next task is seeded with a digest of the first and
+the most recent task/answer pairs instead.
+
 Isolation
 =========
-The Manager's ``_execute_step`` wraps every ``tool.forward()`` in a
+The Manager's ``_execute_one`` wraps every ``tool.forward()`` in a
 ``kbench.chats.new()`` sub-chat.  For ``AgentTool``, the inner
 ``contexts.enter(chat=self._worker_chat)`` immediately overrides that
 throwaway chat, so the Manager's orchestrator chat stays clean and the
@@ -29,16 +35,18 @@ worker's persistent chat is unaffected.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
-
-from kaggle_benchmarks import actors as kbench_actors
-from kaggle_benchmarks import chats, contexts
+import asyncio
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Optional, Tuple
 
-from kagentic.prompts import build_system_prompt, build_task_prompt
+from kagentic.prompts import build_task_prompt
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
 if TYPE_CHECKING:
+    from kaggle_benchmarks import chats
+
     from kagentic.agent import CodeAgent
 
 
@@ -56,6 +64,10 @@ class AgentTool(Tool):
                      Defaults to ``agent.name``.
         description: Tool description shown to the Manager LLM.
                      Defaults to ``agent.description`` (or a sensible fallback).
+        max_history_calls: Truncate the worker chat after this many calls,
+                     keeping a digest of the first and the last
+                     ``KEEP_RECENT_CALLS`` exchanges (default 0 = keep the
+                     full history).
 
     Usage::
 
@@ -76,14 +88,20 @@ class AgentTool(Tool):
     """
 
     output_type = "string"
+    KEEP_RECENT_CALLS = 3
 
     def __init__(
         self,
         agent: "CodeAgent",
         name: Optional[str] = None,
         description: Optional[str] = None,
+        max_history_calls: int = 0,
     ):
         self._agent = agent
+        self.max_history_calls = max_history_calls
+        self._calls_in_chat = 0
+        self._first_exchange: Optional[Tuple[str, str]] = None
+        self._recent_exchanges: Deque[Tuple[str, str]] = deque(maxlen=self.KEEP_RECENT_CALLS)
 
         # Tool identity — shown to the Manager LLM in the system prompt
         self.name = name or agent.name or "worker_agent"
@@ -112,17 +130,20 @@ class AgentTool(Tool):
         # The Chat object accumulates messages across all Manager->Worker     #
         # round-trips via contexts.enter(chat=self._worker_chat).             #
         # ------------------------------------------------------------------ #
+        from kaggle_benchmarks import chats
+
         self._worker_chat: chats.Chat = chats.Chat(
             name=f"kagentic_worker_{self.name}"
         )
         self._initialized: bool = False
+        # One call at a time per worker: its chat and step state are not
+        # shareable.  Different workers still run concurrently.
+        self._call_lock = threading.Lock()
 
-        # Pre-build the worker's system prompt once (tools don't change)
-        self._system_prompt: str = build_system_prompt(
-            agent.tools,
-            additional_instructions=agent.additional_instructions,
-            response_format=agent.response_format,
-        )
+        # The worker's system prompt is rendered on the first forward() call
+        # (a Manager may register workers it never delegates to).  Shares the
+        # worker agent's own cached render.
+        self._system_prompt: Optional[str] = None
 
     # ---------------------------------------------------------------------- #
     # Tool interface                                                           #
@@ -137,6 +158,26 @@ class AgentTool(Tool):
         Subsequent calls re-enter the same Chat, preserving full history so
         the worker remembers all previous task/result exchanges.
         """
+        with self._call_lock:
+            return self._forward_locked(task)
+
+    async def aforward(self, task: str) -> str:
+        """
+        Async counterpart of ``forward()``, mirroring ``CodeAgent.arun``.
+
+        The worker's ReAct loop runs in a thread (``asyncio.to_thread`` copies
+        the caller's contextvars, so the kbench chat hierarchy is kept), so
+        several workers can be driven at once::
+
+            results = await asyncio.gather(search_tool.aforward(q1), code_tool.aforward(q2))
+
+        Inside a Manager this is not needed: independent AgentTool calls in one
+        step's ``parallel_actions`` already run concurrently.
+        """
+        return await asyncio.to_thread(self.forward, task)
+
+    def _initialize(self) -> None:
+        """First call only: attach the worker chat to the UI and seed it."""
         # ── UI visibility ──────────────────────────────────────────────────
         # `chats.new()` makes a sub-chat visible in the UI by calling
         #   ctx.parent.chat.append(ctx.chat)
@@ -146,16 +187,46 @@ class AgentTool(Tool):
         # Our `contexts.enter(chat=worker_chat)` skips that step, so we do
         # it manually on the FIRST call only (subsequent calls re-enter the
         # same chat object that is already in the hierarchy).
-        if not self._initialized:
-            current_parent = chats.get_current_chat()
-            current_parent.append(self._worker_chat)
+        from kaggle_benchmarks import actors as kbench_actors
+        from kaggle_benchmarks import chats, contexts
 
+        chats.get_current_chat().append(self._worker_chat)
         with contexts.enter(chat=self._worker_chat):
-            if not self._initialized:
-                # Seed the worker chat with system instructions on first call.
-                kbench_actors.system.send(self._system_prompt)
-                self._initialized = True
+            # Seed the worker chat with system instructions.
+            self._system_prompt = self._agent._get_system_prompt()
+            kbench_actors.system.send(self._system_prompt)
+            self._agent._reset_transcript(self._system_prompt)
+        self._initialized = True
+
+    def _forward_locked(self, task: str) -> str:
+        from kaggle_benchmarks import chats, contexts
+
+        seed_context = None
+        if self._initialized and self.max_history_calls and self._calls_in_chat >= self.max_history_calls:
+            # History bound reached: restart from the system prompt and
+            # carry the earlier exchanges over as a digest.
+            truncate = getattr(chats, "truncate", None)
+            if truncate is not None:
+                with contexts.enter(chat=self._worker_chat):
+                    truncate(keep_system=True)
+                self._agent._reset_transcript(self._system_prompt)
+            else:
+                # Older kbench without in-place truncation: continue in a
+                # fresh worker chat, re-seeded with the system prompt.
+                self._worker_chat = chats.Chat(name=f"kagentic_worker_{self.name}")
+                self._initialized = False
+            seed_context = self._history_digest()
+            self._calls_in_chat = 0
 
+        if not self._initialized:
+            self._initialize()
+
+        # Step / token budgets are per task: without this a worker that once
+        # reached compress_token_budget would ask to compress on every step
+        # of every later call.
+        self._agent.memory.reset()
+
+        with contexts.enter(chat=self._worker_chat):
             # Send this task as the next user message, then run the worker's
             # ReAct loop.  _inner_loop() operates on the currently-active chat
             # (self._worker_chat) — no new kbench.chats.new() is opened.
@@ -163,12 +234,30 @@ class AgentTool(Tool):
             result = self._agent._inner_loop(
                 task_prompt=task_prompt,
                 max_steps=self._agent.max_steps,
-                seed_context=None,
+                seed_context=seed_context,
             )
 
         if result.is_final:
-            return str(result.parsed if result.parsed is not None else result.output)
-        return f"[{self.name}] Reached max steps without a final answer."
+            answer = str(result.parsed if result.parsed is not None else result.output)
+        else:
+            answer = f"[{self.name}] Reached max steps without a final answer."
+        self._calls_in_chat += 1
+        if self._first_exchange is None:
+            self._first_exchange = (task, answer)
+        else:
+            self._recent_exchanges.append((task, answer))
+        return answer
+
+    def _history_digest(self) -> str:
+        """Render the first and the most recent task/answer pairs for a fresh chat."""
+        limit = self._agent.memory.OBSERVATION_CHARS
+        lines = ["Earlier tasks from the manager and your answers (older ones trimmed):"]
+        exchanges = [self._first_exchange, *self._recent_exchanges]
+        for i, (task, answer) in enumerate(exchanges, 1):
+            if len(answer) > limit:
+                answer = answer[:limit] + " …"
+            lines.append(f"[{i}] Task: {task}\n  → {answer}")
+        return "\n".join(lines)
 
     def __repr__(self) -> str:
         return f"AgentTool(name='{self.name}', agent={self._agent!r})"
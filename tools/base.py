@@ -64,7 +64,16 @@ class Tool:
         """
         Render this tool as an OpenAI-style function-call JSON schema.
         Used by build_system_prompt() to describe available tools to the LLM.
+
+        The dict is built once and reused until ``name``, ``description`` or
+        an entry of ``inputs`` changes; treat it as read-only.
         """
+        # ToolInput is frozen, so a snapshot of the items is a complete key.
+        key = (self.name, self.description, tuple(self.inputs.items()))
+        cached = self.__dict__.get("_json_schema")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         properties = {}
         required = []
         for param_name, tool_input in self.inputs.items():
@@ -75,7 +84,7 @@ class Tool:
             if tool_input.required:
                 required.append(param_name)
 
-        return {
+        schema = {
             "name": self.name,
             "description": self.description,
             "parameters": {
@@ -84,6 +93,8 @@ class Tool:
                 "required": required,
             },
         }
+        self._json_schema = (key, schema)
+        return schema
 
     def __repr__(self) -> str:
         return f"Tool(name='{self.name}')"
\ No newline at end of file
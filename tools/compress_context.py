@@ -0,0 +1,33 @@
+"""
+kagentic/tools/compress_context.py
+---------------------------------
+CompressContextTool lets the agent decide when to compress its own context.
+
+Registered automatically by CodeAgent(compress_tool=True).  When the LLM
+calls compress_context, the agent loop intercepts it (like final_answer)
+and ends the current chat window through the normal compression restart:
+the history is summarised and a fresh kbench.chats.new() is seeded with it.
+``compress_threshold`` still applies as a hard upper bound if set.
+"""
+from __future__ import annotations
+
+from kagentic.tools.base import Tool
+
+# Returned by forward() if the tool is ever called outside the agent loop.
+COMPRESS_SENTINEL = "__COMPRESS__"
+
+
+class CompressContextTool(Tool):
+    name = "compress_context"
+    description = (
+        "Compress your working memory: everything done so far is summarised and "
+        "the conversation restarts from that summary. Call this when earlier steps "
+        "(long tool outputs, finished sub-tasks, dead ends) are no longer needed in "
+        "full detail. Do NOT call it right before final_answer."
+    )
+    inputs = {}
+    output_type = "string"
+
+    def forward(self) -> str:  # noqa: D401
+        """Pass-through — the agent loop intercepts this before forward() runs."""
+        return COMPRESS_SENTINEL
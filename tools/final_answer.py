@@ -18,7 +18,7 @@ happen at construction time:
    Because tool descriptions are re-emitted on every LLM turn, this keeps
    the schema in the model's active attention window even for long contexts.
 
-2. ``parse_answer(raw)`` is called by ``_execute_step`` when the LLM fires
+2. ``parse_answer(raw)`` is called by ``_execute_one`` when the LLM fires
    ``final_answer``.  It runs a multi-strategy parse waterfall to tolerate
    common LLM formatting quirks (single-quote dicts, plain strings, etc.).
    On failure it raises ``ValueError`` — the caller converts this into an
@@ -28,17 +28,14 @@ happen at construction time:
 from __future__ import annotations
 
 import ast
+import copy
+import functools
 import json
 from typing import Any, Optional
 
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
-try:
-    from json_repair import loads as json_repair_loads
-except ImportError:
-    json_repair_loads = None  # type: ignore[assignment]
-
 
 # Default descriptions (used when no response_format is set)
 _DEFAULT_DESCRIPTION = (
@@ -49,6 +46,81 @@ _DEFAULT_DESCRIPTION = (
 _DEFAULT_ANSWER_DESCRIPTION = "The final answer to return to the user."
 
 
+class _ParseFailure:
+    """Cached outcome of a raw answer that no parse strategy accepted."""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(model_cls: Any, raw: str) -> Any:
+    """Run the parse waterfall for ``(model_cls, raw)``; see ``parse_answer``.
+
+    Pure and deterministic, so memoized: an agent that retries with the same
+    malformed answer does not pay for every failing strategy again.  Failures
+    are cached as ``_ParseFailure`` rather than raised.
+
+    The first characters pick the strategies that can succeed: strategies 2
+    and 3 only accept dicts, so they need a leading ``{``, and ``{'`` can
+    never be JSON, so a Python-style dict goes straight to strategy 3.
+    """
+    last_exc: Exception = RuntimeError("No parse strategy attempted.")
+    head = raw.lstrip()[:2]
+    is_dict = head[:1] == "{"
+    is_json = head != "{'"
+
+    def _validate(data: dict) -> Any:
+        if hasattr(model_cls, "model_validate"):
+            return model_cls.model_validate(data)
+        if hasattr(model_cls, "parse_obj"):
+            return model_cls.parse_obj(data)
+        return model_cls(**data)
+
+    # Strategy 1: Pydantic v2 model_validate_json (strict JSON)
+    if is_json and hasattr(model_cls, "model_validate_json"):
+        try:
+            return model_cls.model_validate_json(raw)
+        except Exception as exc:
+            last_exc = exc
+
+    # Strategy 2: json.loads → model_validate
+    if is_dict and is_json:
+        try:
+            data = json.loads(raw)
+            if isinstance(data, dict):
+                return _validate(data)
+        except Exception as exc:
+            last_exc = exc
+
+    # Strategy 3: ast.literal_eval for Python-style single-quote dicts
+    # e.g.  "{'city': 'Tokyo', 'temperature_c': 14}"
+    if is_dict:
+        try:
+            data = ast.literal_eval(raw)
+            if isinstance(data, dict):
+                return _validate(data)
+        except Exception as exc:
+            last_exc = exc
+
+    # Strategy 4: json_repair as last resort (imported only when reached)
+    try:
+        from json_repair import loads as json_repair_loads
+    except ImportError:
+        json_repair_loads = None
+    if json_repair_loads is not None:
+        try:
+            data = json_repair_loads(raw)
+            if isinstance(data, dict):
+                return _validate(data)
+        except Exception as exc:
+            last_exc = exc
+
+    return _ParseFailure(last_exc)
+
+
 class FinalAnswerTool(Tool):
     name = "final_answer"
     description = _DEFAULT_DESCRIPTION
@@ -92,12 +164,20 @@ class FinalAnswerTool(Tool):
             f"directly into action.arguments as a plain JSON object: {schema_hint}. "
             f"Do NOT wrap them in a string or nest under an 'answer' key."
         )
-        self.inputs["answer"].description = (
-            f"Pass ALL {model_cls.__name__} fields as direct JSON object keys. "
-            f"Required fields: {schema_hint}. "
-            f"Example: spread fields directly — "
-            f"do NOT use a nested 'answer' string key."
-        )
+        # Per-instance inputs: the class-level ToolInput is shared by every
+        # FinalAnswerTool (including the agents' default instance).
+        self.inputs = {
+            "answer": ToolInput(
+                type="string",
+                description=(
+                    f"Pass ALL {model_cls.__name__} fields as direct JSON object keys. "
+                    f"Required fields: {schema_hint}. "
+                    f"Example: spread fields directly — "
+                    f"do NOT use a nested 'answer' string key."
+                ),
+                required=True,
+            )
+        }
 
 
     def parse_answer(self, raw: str) -> Any:
@@ -112,6 +192,9 @@ class FinalAnswerTool(Tool):
           3. ``ast.literal_eval`` + ``model_validate`` — Python single-quote dicts
           4. ``json_repair`` + ``model_validate`` — last resort
 
+        The waterfall is memoized per ``(response_format, raw)``; a cache hit
+        returns a deep copy of the parsed object.
+
         Raises:
             ValueError: if all strategies fail — caller should convert this
                         into an is_final=False StepResult to trigger a retry.
@@ -120,48 +203,12 @@ class FinalAnswerTool(Tool):
             return raw
 
         model_cls = self.response_format
-        last_exc: Exception = RuntimeError("No parse strategy attempted.")
-
-        def _validate(data: dict) -> Any:
-            if hasattr(model_cls, "model_validate"):
-                return model_cls.model_validate(data)
-            if hasattr(model_cls, "parse_obj"):
-                return model_cls.parse_obj(data)
-            return model_cls(**data)
-
-        # Strategy 1: Pydantic v2 model_validate_json (strict JSON)
-        if hasattr(model_cls, "model_validate_json"):
-            try:
-                return model_cls.model_validate_json(raw)
-            except Exception as exc:
-                last_exc = exc
-
-        # Strategy 2: json.loads → model_validate
-        try:
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                return _validate(data)
-        except Exception as exc:
-            last_exc = exc
-
-        # Strategy 3: ast.literal_eval for Python-style single-quote dicts
-        # e.g.  "{'city': 'Tokyo', 'temperature_c': 14}"
-        try:
-            data = ast.literal_eval(raw)
-            if isinstance(data, dict):
-                return _validate(data)
-        except Exception as exc:
-            last_exc = exc
-
-        # Strategy 4: json_repair as last resort
-        if json_repair_loads is not None:
-            try:
-                data = json_repair_loads(raw)
-                if isinstance(data, dict):
-                    return _validate(data)
-            except Exception as exc:
-                last_exc = exc
+        result = _parse_cached(model_cls, raw)
+        if not isinstance(result, _ParseFailure):
+            # Callers own the returned object; never hand out the cached one.
+            return copy.deepcopy(result)
 
+        last_exc = result.exc
         raise ValueError(
             f"[kagentic] response_format={model_cls.__name__!r}: "
             f"all parse strategies failed.\n"
@@ -174,8 +221,13 @@ class FinalAnswerTool(Tool):
     # ------------------------------------------------------------------
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _build_schema_hint(model_cls: Any) -> str:
-        """Return a compact one-line schema description, e.g. ``{city: string, ...}``."""
+        """Return a compact one-line schema description, e.g. ``{city: string, ...}``.
+
+        Memoized per class: every agent built with the same response_format
+        would otherwise re-run ``model_json_schema()`` twice.
+        """
         try:
             if hasattr(model_cls, "model_json_schema"):
                 schema = model_cls.model_json_schema()
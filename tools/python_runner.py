@@ -6,12 +6,174 @@ Relies on kbench.tools.python.script_runner which is available in every
 Kaggle Benchmarks notebook environment.
 
 The tool runs the code in an isolated subprocess and returns stdout + stderr.
+
+Outside Kaggle the fallback runs snippets through a small fork server: one
+long-lived child interpreter that ``fork()``s a fresh process per snippet,
+so each run is still isolated but skips interpreter start-up and site init.
+Platforms without ``fork`` (and concurrent calls while the server is busy)
+spawn a plain ``python -c`` subprocess instead.
 """
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any, Optional, Tuple
+
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
+_TIMEOUT = 30
+_PYTHON = sys.executable
+
+# Runs inside the fork server.  Protocol, one request at a time:
+#   in:  a JSON header line {"out", "err", "cwd", "env", "size"}, then ``size`` bytes of code
+#   out: "<pid>\n" once the snippet's process is forked, "<exit code>\n" when it ends
+_FORK_SERVER = r"""
+import json, os, sys, traceback
+rd, wr = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    header = rd.readline()
+    if not header:
+        break
+    req = json.loads(header)
+    source = rd.read(req["size"]).decode("utf-8")
+    pid = os.fork()
+    if pid == 0:
+        status = 0
+        try:
+            for fd, path in ((1, req["out"]), (2, req["err"])):
+                os.dup2(os.open(path, os.O_WRONLY | os.O_TRUNC), fd)
+            os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+            os.chdir(req["cwd"])
+            os.environ.clear()
+            os.environ.update(req["env"])
+            exec(compile(source, "<string>", "exec"), {"__name__": "__main__"})
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                status = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                status = 1
+        except BaseException as e:
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            status = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+    wr.write(b"%d\n" % pid)
+    wr.flush()
+    _, st = os.waitpid(pid, 0)
+    wr.write(b"%d\n" % os.waitstatus_to_exitcode(st))
+    wr.flush()
+"""
+
+
+class _ForkServer:
+    """Lazily started fork server; serves one snippet at a time."""
+
+    def __init__(self) -> None:
+        self._proc: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def run(self, code: str, timeout: float) -> Optional[Tuple[str, str, int]]:
+        """Return ``(stdout, stderr, exit_code)``, or ``None`` if the server is
+        busy or unavailable (the caller then spawns a subprocess itself).
+
+        Raises ``subprocess.TimeoutExpired`` if the snippet outlives ``timeout``.
+        """
+        if not hasattr(os, "fork") or not self._lock.acquire(blocking=False):
+            return None
+        out_fd, out_path = tempfile.mkstemp(prefix="kagentic_out_")
+        err_fd, err_path = tempfile.mkstemp(prefix="kagentic_err_")
+        os.close(out_fd)
+        os.close(err_fd)
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                # Unbuffered: a raw readline() never reads past its newline, so
+                # the exit-code line is still in the pipe when _wait() selects
+                # on it, even if the snippet ended before the pid was read.
+                self._proc = subprocess.Popen(
+                    [_PYTHON, "-c", _FORK_SERVER],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    bufsize=0,
+                )
+            proc = self._proc
+            payload = code.encode("utf-8")
+            # The caller's current environment, not the one the server was
+            # started with (e.g. an API key set in a later notebook cell).
+            header = {
+                "out": out_path,
+                "err": err_path,
+                "cwd": os.getcwd(),
+                "env": dict(os.environ),
+                "size": len(payload),
+            }
+            try:
+                _write_all(proc.stdin, json.dumps(header).encode() + b"\n" + payload)
+                pid = int(proc.stdout.readline())
+            except (OSError, ValueError):
+                self._restart()
+                return None
+            try:
+                exit_code = self._wait(proc, pid, timeout)
+            except (OSError, ValueError):
+                # Server died or the protocol desynced mid-snippet: start a
+                # fresh one next time and let the caller run this one itself.
+                self._restart()
+                return None
+            with open(out_path, encoding="utf-8", errors="replace") as f:
+                stdout = f.read()
+            with open(err_path, encoding="utf-8", errors="replace") as f:
+                stderr = f.read()
+            return stdout, stderr, exit_code
+        finally:
+            os.unlink(out_path)
+            os.unlink(err_path)
+            self._lock.release()
+
+    def _restart(self) -> None:
+        """Kill the server so the next call starts a fresh one."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    @staticmethod
+    def _wait(proc: Any, pid: int, timeout: float) -> int:
+        import selectors
+
+        with selectors.DefaultSelector() as sel:
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            ready = sel.select(timeout)
+        if ready:
+            return int(proc.stdout.readline())
+
+        import signal
+
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # Exited (and was reaped) right at the deadline: its exit code is
+            # on the way, so report it like any other finished run.
+            return int(proc.stdout.readline())
+        int(proc.stdout.readline())  # the server reports the killed child
+        raise subprocess.TimeoutExpired([_PYTHON, "-c", "..."], timeout)
+
+
+def _write_all(pipe: Any, data: bytes) -> None:
+    """Write all of ``data`` to an unbuffered pipe (raw writes may be partial)."""
+    view = memoryview(data)
+    while view:
+        view = view[pipe.write(view):]
+
+
+_fork_server = _ForkServer()
+
 
 class PythonCodeRunnerTool(Tool):
     name = "python_interpreter"
@@ -53,20 +215,24 @@ class PythonCodeRunnerTool(Tool):
 
         except ImportError:
             # Fallback for local testing outside Kaggle
-            import subprocess
-            import sys
-
-            proc = subprocess.run(
-                [sys.executable, "-c", code],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _fork_server.run(code, _TIMEOUT)
+            if result is None:
+                # close_fds=False lets CPython use posix_spawn/vfork instead of
+                # fork+exec and skips closing every inherited descriptor.
+                proc = subprocess.run(
+                    [_PYTHON, "-c", code],
+                    capture_output=True,
+                    text=True,
+                    timeout=_TIMEOUT,
+                    close_fds=False,
+                )
+                result = (proc.stdout, proc.stderr, proc.returncode)
+            stdout, stderr, _ = result
             parts = []
-            if proc.stdout.strip():
-                parts.append(f"[stdout]\n{proc.stdout.strip()}")
-            if proc.stderr.strip():
-                parts.append(f"[stderr]\n{proc.stderr.strip()}")
+            if stdout.strip():
+                parts.append(f"[stdout]\n{stdout.strip()}")
+            if stderr.strip():
+                parts.append(f"[stderr]\n{stderr.strip()}")
             return "\n".join(parts) if parts else "(no output)"
 
         except Exception as e:
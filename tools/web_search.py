@@ -4,16 +4,25 @@ kagentic/tools/web_search.py
 WebSearchTool: search the web and return result snippets + URLs.
 
 Primary:  ddgs package (no API key, handles bot-detection properly)
-Fallback: DuckDuckGo Lite HTML endpoint (requests + BeautifulSoup)
+Fallback: DuckDuckGo Lite HTML endpoint (requests + selectolax, or BeautifulSoup)
 
 Install:
     !pip install -q ddgs requests beautifulsoup4
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
+import queue
+import re
+import threading
+import time
 import urllib.parse
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from kagentic.tools._http import get_session, prefetch
 from kagentic.tools.base import Tool
 from kagentic.types import ToolInput
 
@@ -26,6 +35,89 @@ _HEADERS = {
     ),
     "Accept-Language": "en-US,en;q=0.9",
 }
+# Lite POST: the form fields other than the query never change, so they are
+# encoded once; requests then sends the bytes as-is instead of re-encoding a
+# dict on every search.
+_LITE_HEADERS = {**_HEADERS, "Content-Type": "application/x-www-form-urlencoded"}
+_LITE_FORM_TAIL = "&" + urllib.parse.urlencode(
+    {"s": "0", "o": "json", "dc": "", "v": "l", "api": "d.js"}
+)
+# Result URLs as rendered by both search backends below.
+_URL_LINE = re.compile(r"^    URL: (https?://\S+)$", re.MULTILINE)
+
+# (normalized query, num_results) -> (stored_at, result), most recent last.
+_RESULT_CACHE_MAX = 512
+_result_cache: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+_result_lock = threading.Lock()
+# (normalized query, num_results) -> when every backend last failed for it.
+_FAILURE_CACHE_MAX = 256
+_failed_at: "OrderedDict[Tuple[str, int], float]" = OrderedDict()
+# Searches currently on the wire, so concurrent duplicates share one request.
+_inflight: Dict[Tuple[str, int], Future] = {}
+# Concurrent searches per forward_batch() call; keeps DDG from rate-limiting us.
+_BATCH_CONCURRENCY = 4
+
+
+def _cached_result(key: Tuple[str, int], ttl: float) -> Optional[str]:
+    with _result_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _store_result(key: Tuple[str, int], result: str) -> None:
+    with _result_lock:
+        _result_cache[key] = (time.monotonic(), result)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > _RESULT_CACHE_MAX:
+            _result_cache.popitem(last=False)
+
+
+def _recently_failed(key: Tuple[str, int], ttl: float) -> bool:
+    with _result_lock:
+        failed_at = _failed_at.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at >= ttl:
+            del _failed_at[key]
+            return False
+        return True
+
+
+def _note_failure(key: Tuple[str, int]) -> None:
+    with _result_lock:
+        _failed_at[key] = time.monotonic()
+        _failed_at.move_to_end(key)
+        while len(_failed_at) > _FAILURE_CACHE_MAX:
+            _failed_at.popitem(last=False)
+
+
+def _single_flight(key: Tuple[str, int], search: Callable[[], Optional[str]]) -> Optional[str]:
+    """Run ``search()`` unless an identical search is already in flight, in
+    which case wait for that one and return its result instead."""
+    with _result_lock:
+        pending = _inflight.get(key)
+        owner = pending is None
+        if owner:
+            pending = _inflight[key] = Future()
+    if not owner:
+        return pending.result()
+    try:
+        result = search()
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    else:
+        pending.set_result(result)
+        return result
+    finally:
+        with _result_lock:
+            _inflight.pop(key, None)
 
 
 class WebSearchTool(Tool):
@@ -35,8 +127,22 @@ class WebSearchTool(Tool):
 
     Use WebBrowseTool to read the full content of a specific URL.
 
-    Dependencies: duckduckgo-search (primary), requests + beautifulsoup4 (fallback)
+    Dependencies: duckduckgo-search (primary), requests + selectolax or beautifulsoup4 (fallback)
     Install with: !pip install -q duckduckgo-search requests beautifulsoup4
+
+    Args:
+        prefetch_top_k: Start fetching the top K result pages in the
+                        background so a following ``web_browse`` of one of
+                        them is served from the prefetch cache (default 0 =
+                        off; costs K page downloads per search).
+        cache_ttl: Seconds a search result is reused for a repeat of the same
+                   query (case- and whitespace-insensitive) and
+                   ``num_results`` (default 600; 0 = no caching).  Failed
+                   and empty searches are never cached.
+        failure_ttl: Seconds a query on which every backend failed (e.g. DDG
+                     rate-limiting us) is answered with the failure message
+                     without touching the network, so immediate retries do
+                     not prolong the block (default 30; 0 = off).
     """
 
     name = "web_search"
@@ -57,18 +163,24 @@ class WebSearchTool(Tool):
         ),
     }
     output_type = "string"
+    prefetch_top_k: int = 0
+    cache_ttl: float = 600.0
+    failure_ttl: float = 30.0
 
     def forward(self, query: str, num_results: int = 5) -> str:
         num_results = max(1, min(int(num_results), 10))
 
-        # --- Primary: duckduckgo-search package ---
-        result = _search_with_ddgs(query, num_results)
-        if result is not None:
-            return result
+        key = (query.strip().lower(), num_results)
+        result = _cached_result(key, self.cache_ttl) if self.cache_ttl > 0 else None
+
+        if result is None and not (self.failure_ttl > 0 and _recently_failed(key, self.failure_ttl)):
+            result = _single_flight(key, lambda: self._search(key, query, num_results))
 
-        # --- Fallback: DuckDuckGo Lite HTML scraping ---
-        result = _search_with_lite(query, num_results)
         if result is not None:
+            if self.prefetch_top_k > 0:
+                from kagentic.tools.web_browse import _HEADERS as browse_headers
+
+                prefetch(_URL_LINE.findall(result)[: self.prefetch_top_k], browse_headers)
             return result
 
         return (
@@ -78,30 +190,152 @@ class WebSearchTool(Tool):
             "  !pip install -q requests beautifulsoup4"
         )
 
+    def forward_batch(self, queries: List[str], num_results: int = 5) -> Dict[str, str]:
+        """
+        Run several searches concurrently and return ``{query: forward() result}``.
+
+        At most ``_BATCH_CONCURRENCY`` searches are on the wire at once.  Each
+        query goes through ``forward()``, so the result cache and the
+        coalescing of duplicate in-flight searches apply as usual.
+        """
+        unique = list(dict.fromkeys(queries))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(_BATCH_CONCURRENCY, len(unique))) as pool:
+            results = pool.map(lambda q: self.forward(q, num_results), unique)
+            return dict(zip(unique, results))
+
+    def _search(self, key: Tuple[str, int], query: str, num_results: int) -> Optional[str]:
+        # --- Primary: duckduckgo-search package ---
+        result = _search_with_ddgs(query, num_results)
+
+        # --- Fallback: DuckDuckGo Lite HTML scraping ---
+        if result is None:
+            result = _search_with_lite(query, num_results)
+
+        # Stored before the in-flight entry is dropped, so a later caller
+        # either joins this search or finds its result (or failure) cached.
+        if result is None:
+            if self.failure_ttl > 0:
+                _note_failure(key)
+        elif self.cache_ttl > 0 and not result.startswith("[WebSearchTool]"):
+            _store_result(key, result)
+        return result
+
+    async def aforward(self, query: str, num_results: int = 5) -> str:
+        """
+        Async counterpart of ``forward()``, so several searches can be awaited
+        together without blocking the event loop::
+
+            results = await asyncio.gather(*(search.aforward(q) for q in queries))
+
+        The blocking DDGS / requests calls run in a worker thread and share
+        the pooled ``requests.Session`` from ``_http``.
+        """
+        return await asyncio.to_thread(self.forward, query, num_results)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached search result and remembered failure (shared by
+        all WebSearchTool instances)."""
+        with _result_lock:
+            _result_cache.clear()
+            _failed_at.clear()
+
+
+def _format_results(query: str, hits: Iterable[Tuple[str, str, str]]) -> str:
+    """Render ``(title, url, snippet)`` hits in the format both backends share.
+
+    One f-string per hit and a single join; ``_URL_LINE`` parses this format.
+    """
+    blocks = "\n\n".join(
+        [f"[{i}] {title}\n    URL: {url}\n    {snippet}" for i, (title, url, snippet) in enumerate(hits, 1)]
+    )
+    return f"Search results for '{query}':\n\n{blocks}"
+
 
 # ---------------------------------------------------------------------------
 # Primary: duckduckgo-search package
 # ---------------------------------------------------------------------------
 
+# Idle DDGS clients.  A search checks one out and returns it afterwards, so
+# clients are reused across threads (including forward_batch's short-lived
+# pool threads) and there are never more than the peak number of
+# concurrent searches.
+_ddgs_idle: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+# Optional-dependency lookups below are remembered only once they succeed,
+# so installing a missing package mid-session takes effect on the next call.
+_ddgs_class: Any = None
+_soup_parser: Optional[Tuple[Any, str]] = None
+_lite_parser: Optional[Callable[[str, int], Tuple[List[Tuple[str, str]], List[str]]]] = None
+
+
+def _get_ddgs_class() -> Any:
+    """Return ``ddgs.DDGS``, or ``None`` if it is not installed."""
+    global _ddgs_class
+    if _ddgs_class is None:
+        try:
+            from ddgs import DDGS
+        except ImportError:
+            return None
+        _ddgs_class = DDGS
+    return _ddgs_class
+
+
+def _checkout_ddgs() -> Any:
+    """Take an idle ``DDGS`` client (creating one if none is free), or ``None``
+    if ddgs is not installed.  Hand it back with ``_ddgs_idle.put()``."""
+    try:
+        return _ddgs_idle.get_nowait()
+    except queue.Empty:
+        DDGS = _get_ddgs_class()
+        return DDGS() if DDGS is not None else None
+
+
+def _close_ddgs(client: Any) -> None:
+    """Release ``client`` the way leaving ``with DDGS() as ...`` would."""
+    try:
+        client.__exit__(None, None, None)
+    except Exception:
+        pass
+
+
+def _close_idle_ddgs() -> None:
+    while True:
+        try:
+            client = _ddgs_idle.get_nowait()
+        except queue.Empty:
+            return
+        _close_ddgs(client)
+
+
+atexit.register(_close_idle_ddgs)
+
+
 def _search_with_ddgs(query: str, num_results: int) -> str | None:
     """Use the duckduckgo_search package (most reliable, no bot detection)."""
     try:
-        from ddgs import DDGS
-
-        results: List[str] = []
-        with DDGS() as ddgs:
+        ddgs = _checkout_ddgs()
+        if ddgs is None:
+            return None  # package not installed, try fallback
+        try:
             hits = list(ddgs.text(query, max_results=num_results))
+        except BaseException:
+            _close_ddgs(ddgs)  # possibly broken: never hand it out again
+            raise
+        _ddgs_idle.put(ddgs)
 
         if not hits:
             return f"[WebSearchTool] No results found for query: '{query}'"
 
-        for i, hit in enumerate(hits):
-            title = hit.get("title", "No title")
-            url = hit.get("href", "")
-            snippet = hit.get("body", "No snippet")
-            results.append(f"[{i+1}] {title}\n    URL: {url}\n    {snippet}")
-
-        return f"Search results for '{query}':\n\n" + "\n\n".join(results)
+        return _format_results(
+            query,
+            (
+                (hit.get("title", "No title"), hit.get("href", ""), hit.get("body", "No snippet"))
+                for hit in hits
+            ),
+        )
 
     except ImportError:
         return None  # package not installed, try fallback
@@ -113,39 +347,155 @@ def _search_with_ddgs(query: str, num_results: int) -> str | None:
 # Fallback: DuckDuckGo Lite HTML scraping
 # ---------------------------------------------------------------------------
 
+def _get_soup_parser() -> Optional[Tuple[Any, str]]:
+    """Return ``(BeautifulSoup, parser_name)``, or ``None`` if bs4 is missing.
+
+    Prefers lxml, which is several times faster than the pure-Python
+    ``html.parser`` on the Lite results page.
+    """
+    global _soup_parser
+    if _soup_parser is None:
+        try:
+            from bs4 import BeautifulSoup
+        except ImportError:
+            return None
+        try:
+            import lxml  # noqa: F401
+            _soup_parser = BeautifulSoup, "lxml"
+        except ImportError:
+            _soup_parser = BeautifulSoup, "html.parser"
+    return _soup_parser
+
+
+# DDG Lite results: <a class="result-link"> + adjacent <td class="result-snippet">.
+# Each parser returns ([(title, url), ...], [snippet, ...]) in page order.
+
+def _parse_lite_selectolax(html: str, num_results: int) -> Tuple[List[Tuple[str, str]], List[str]]:
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html)
+    links = [
+        (a.text(strip=True), a.attributes.get("href") or "")
+        for a in tree.css("a.result-link")[:num_results]
+    ]
+    snippets = [td.text(strip=True) for td in tree.css("td.result-snippet")[:num_results]]
+    return links, snippets
+
+
+def _parse_lite_bs4(html: str, num_results: int) -> Tuple[List[Tuple[str, str]], List[str]]:
+    BeautifulSoup, parser = _get_soup_parser()
+
+    soup = BeautifulSoup(html, parser)
+    links = [
+        (a.get_text(strip=True), a.get("href", ""))
+        for a in soup.select("a.result-link")[:num_results]
+    ]
+    snippets = [td.get_text(strip=True) for td in soup.select("td.result-snippet")[:num_results]]
+    return links, snippets
+
+
+def _get_lite_parser() -> Optional[Callable[[str, int], Tuple[List[Tuple[str, str]], List[str]]]]:
+    """Return the fastest available Lite-page parser, or ``None`` if neither
+    selectolax nor bs4 is installed."""
+    global _lite_parser
+    if _lite_parser is None:
+        try:
+            import selectolax  # noqa: F401
+            _lite_parser = _parse_lite_selectolax
+        except ImportError:
+            if _get_soup_parser() is None:
+                return None
+            _lite_parser = _parse_lite_bs4
+    return _lite_parser
+
+
+# Opening tag of a result's snippet cell (not the stylesheet rule in <head>).
+_SNIPPET_CELL = re.compile(rb"""class=["']result-snippet["']""")
+
+
+def _read_lite_html(resp: Any, num_results: int) -> str:
+    """Stream the Lite results page, stopping once the ``num_results``-th
+    snippet cell has closed — the parsers only look at the first
+    ``num_results`` rows, so the rest is neither downloaded nor parsed."""
+    buf = bytearray()
+    seen = 0
+    pos = 0
+    for chunk in resp.iter_content(chunk_size=8192):
+        buf += chunk
+        while seen < num_results:
+            match = _SNIPPET_CELL.search(buf, pos)
+            if match is None:
+                break
+            seen += 1
+            pos = match.end()
+        if seen >= num_results and buf.find(b"</td>", pos) >= 0:
+            break
+        if seen < num_results:
+            pos = max(pos, len(buf) - 32)  # a tag may straddle two chunks
+    encoding = resp.encoding or "utf-8"
+    try:
+        return buf.decode(encoding, errors="replace")
+    except LookupError:  # unknown charset label from the server
+        return buf.decode("utf-8", errors="replace")
+
+
+# Circuit breaker: after _LITE_TRIP_AFTER consecutive failures (errors or
+# empty result pages, i.e. a soft block) the Lite endpoint is skipped for
+# _LITE_COOLDOWN seconds instead of every search waiting out its timeout.
+_LITE_TRIP_AFTER = 3
+_LITE_COOLDOWN = 60.0
+_lite_lock = threading.Lock()
+_lite_failures = 0
+_lite_open_until = 0.0
+
+
+def _lite_record(ok: bool) -> None:
+    global _lite_failures, _lite_open_until
+    with _lite_lock:
+        if ok:
+            _lite_failures = 0
+            return
+        _lite_failures += 1
+        if _lite_failures >= _LITE_TRIP_AFTER:
+            _lite_open_until = time.monotonic() + _LITE_COOLDOWN
+            _lite_failures = 0
+
+
 def _search_with_lite(query: str, num_results: int) -> str | None:
     """Scrape DuckDuckGo Lite (simpler HTML, less bot detection than main endpoint)."""
+    if time.monotonic() < _lite_open_until:
+        return None  # circuit open: recently blocked, don't wait on it again
+    parse = _get_lite_parser()
+    if parse is None:
+        return None
     try:
-        import requests
-        from bs4 import BeautifulSoup
-
-        resp = requests.post(
+        with get_session().post(
             _LITE_URL,
-            data={"q": query, "s": "0", "o": "json", "dc": "", "v": "l", "api": "d.js"},
-            headers=_HEADERS,
+            data=(urllib.parse.urlencode({"q": query}) + _LITE_FORM_TAIL).encode("ascii"),
+            headers=_LITE_HEADERS,
             timeout=10,
-        )
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            html = _read_lite_html(resp, num_results)
 
-        # DDG Lite results: <a class="result-link"> + adjacent <td class="result-snippet">
-        links = soup.select("a.result-link")[:num_results]
-        snippets = soup.select("td.result-snippet")
+        links, snippets = parse(html, num_results)
 
         if not links:
+            _lite_record(False)
             return None  # might still be blocked, signal fallback failure
 
-        results: List[str] = []
-        for i, link in enumerate(links):
-            title = link.get_text(strip=True)
-            url = link.get("href", "")
-            snippet = snippets[i].get_text(strip=True) if i < len(snippets) else ""
-            results.append(f"[{i+1}] {title}\n    URL: {url}\n    {snippet}")
-
-        return f"Search results for '{query}':\n\n" + "\n\n".join(results)
+        _lite_record(True)
+        return _format_results(
+            query,
+            (
+                (title, url, snippets[i] if i < len(snippets) else "")
+                for i, (title, url) in enumerate(links)
+            ),
+        )
 
     except ImportError:
         return None
     except Exception:
+        _lite_record(False)
         return None
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """
     A document with text content and optional metadata.
@@ -22,20 +22,23 @@ class Document:
         return f"Document(content='{preview}...', metadata={self.metadata})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolInput:
     """
     Descriptor for a single tool parameter — shown to the LLM in the system prompt.
+
+    Immutable (and hashable): to change a parameter, assign a new ToolInput.
     """
     type: str                        # e.g. "string", "integer", "boolean"
     description: str
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """
-    Result of one ReAct loop iteration.
+    Result of one ReAct loop iteration (slotted, like ``StepRecord``: one is
+    built per tool call).
 
     Fields:
         tool_name:  Name of the tool that was called.
@@ -48,3 +51,27 @@ class StepResult:
     output: str
     is_final: bool
     parsed: Any = None
+
+
+@dataclass(slots=True)
+class StepRecord:
+    """
+    One entry of a run's step history, returned by ``CodeAgent.run()`` when
+    ``return_full_result=True``.
+
+    Slotted rather than a plain dict: smaller per step and faster to build.
+
+    Fields:
+        step_idx:   Position of this record in the run history.
+        thought:    The LLM's reasoning for the step (may be None).
+        tool_name:  Name of the tool that was called.
+        output:     Raw string output from the tool.
+        is_final:   True when this record is the final answer.
+        parsed:     Parsed final answer (see ``StepResult.parsed``).
+    """
+    step_idx: int
+    thought: Optional[str]
+    tool_name: str
+    output: str
+    is_final: bool
+    parsed: Any = None